@@ -0,0 +1,25 @@
+"""
+Cache backends.
+"""
+from django.core.cache.backends.filebased import FileBasedCache
+
+
+class InfrequentlyCulledFileCache(FileBasedCache):
+    """
+    A FileBasedCache that checks whether it has outgrown MAX_ENTRIES once every
+    CULL_EVERY writes, rather than on every write.
+
+    FileBasedCache culls by listing its whole directory, so with tens of thousands of
+    entries every write costs a directory listing. Counting writes per process lets
+    the cache overshoot MAX_ENTRIES by up to CULL_EVERY entries per process between
+    culls, each of which deletes 1/CULL_FREQUENCY of the entries at random.
+    """
+    def __init__(self, dir, params):
+        super().__init__(dir, params)
+        self._cull_every = int(params.get('OPTIONS', {}).get('CULL_EVERY', 1000))
+        self._writes = 0
+
+    def _cull(self):
+        self._writes += 1
+        if self._writes % self._cull_every == 0:
+            super()._cull()
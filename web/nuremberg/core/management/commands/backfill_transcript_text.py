@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from nuremberg.transcripts.models import TranscriptPage
+
+class Command(BaseCommand):
+    help = 'Populates the extracted text, code and hash fields of transcript pages ingested before they existed'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Number of pages updated per query.')
+        parser.add_argument('--all', action='store_true', default=False, help='Re-extract every page, not just missing ones.')
+
+    def handle(self, *args, **options):
+        pages = TranscriptPage.objects.order_by('id')
+        if not options['all']:
+            pages = pages.filter(Q(extracted_text__isnull=True) | Q(xml_hash__isnull=True))
+
+        print('Extracting', pages.count(), 'pages.')
+        count = 0
+        last_id = 0
+        while True:
+            # page by id rather than offset, since the filtered set shrinks as we go
+            batch = list(pages.filter(id__gt=last_id).only('id', 'xml')[:options['batch_size']])
+            if not batch:
+                break
+            for page in batch:
+                page.populate_extracted_fields()
+                page.xml_hash = page.hash_xml(page.xml)
+            # bulk_update leaves updated_at alone, so this doesn't trigger reindexing or re-rendering
+            with transaction.atomic():
+                TranscriptPage.objects.bulk_update(batch,
+                    ['extracted_text', 'extracted_evidence_codes', 'extracted_exhibit_codes', 'xml_hash'])
+            last_id = batch[-1].id
+            count += len(batch)
+            print('Extracted', count, 'pages.')
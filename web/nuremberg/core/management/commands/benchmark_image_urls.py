@@ -0,0 +1,37 @@
+import timeit
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from nuremberg.documents.models import DocumentImage
+from nuremberg.transcripts.models import TranscriptPage
+
+
+class Command(BaseCommand):
+    help = 'Times reading the attributes pages render from each DocumentImage and TranscriptPage, with image proxying on'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=10000, help='Instances of each model to read (default 10000)')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs to take the fastest of (default 5)')
+
+    def handle(self, *args, **options):
+        count = options['count']
+        # a mix of the URL forms stored in the database, thumbnails being the ones rewritten
+        urls = ['/proxy_image/HLSL_NUR_00001001.jpg', '/static/image_cache/thumb/HLSL_NUR_00001001.jpg',
+            'http://nuremberg.law.harvard.edu/imagedir/HLSL_NMT01/HLSL_NUR_00001001.jpg', None]
+        images = [DocumentImage(document_id=1, page_number=n, scale=DocumentImage.SCREEN, url=urls[n % len(urls)],
+            width=800, height=1000, image_type_id=1) for n in range(count)]
+        pages = [TranscriptPage(seq_number=n, page_label=str(n), image_url='//s3.amazonaws.com/nuremberg-transcripts/NRMB-NMT01-{:05d}.jpg'.format(n))
+            for n in range(count)]
+
+        def read_images():
+            for image in images:
+                (image.display_url, image.page_number, image.scale, image.width, image.height)
+
+        def read_pages():
+            for page in pages:
+                (page.display_image_url, page.seq_number, page.page_label, page.date)
+
+        with override_settings(PROXY_DOCUMENT_IMAGE_THUMBS=True, PROXY_TRANSCRIPTS=True):
+            for (label, read) in (('DocumentImage', read_images), ('TranscriptPage', read_pages)):
+                read()
+                best = min(timeit.repeat(read, number=1, repeat=options['repeat']))
+                print('{}: {:.2f} µs per instance'.format(label, best / count * 1e6))
@@ -0,0 +1,156 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from itertools import repeat
+import os
+
+import requests
+from PIL import Image
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import get_storage_class
+from django.core.management.base import BaseCommand
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+from nuremberg.documents.image_size import read_file
+from nuremberg.documents.manifests import write_manifest
+from nuremberg.documents.models import Document, DocumentImage
+
+SCALE_NAMES = dict(DocumentImage.IMAGE_SCALES)
+SCALES = {name: scale for (scale, name) in DocumentImage.IMAGE_SCALES}
+# derivatives are generated from the screen image, so only scales smaller than it
+WIDTHS = {DocumentImage.THUMB: 120, DocumentImage.HALF: 400}
+FORMATS = {'webp': ('WEBP', 'webp'), 'jpeg': ('JPEG', 'jpg')}
+
+
+class Command(BaseCommand):
+    help = 'Generates missing thumb and half scale images from each screen image, saving them to DOCUMENT_IMAGE_STORAGE'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', nargs='+', type=int, default=None, help='Document ids to generate images for (default is all documents)')
+        parser.add_argument('--scales', nargs='+', choices=[SCALE_NAMES[scale] for scale in WIDTHS], default=[SCALE_NAMES[scale] for scale in WIDTHS], help='Scales to generate (default is all of them)')
+        parser.add_argument('--format', choices=FORMATS, default='webp', help='Image format of the generated images (default is webp)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of processes resizing images.')
+        parser.add_argument('--chunk-size', type=int, default=200, help='Number of screen images resized and saved at a time.')
+
+    def handle(self, *args, **options):
+        scales = [SCALES[name] for name in options['scales']]
+        sources = DocumentImage.objects.filter(scale=DocumentImage.SCREEN, url__isnull=False).order_by('document_id', 'page_number')
+        existing = DocumentImage.objects.filter(scale__in=scales)
+        if options['ids']:
+            sources = sources.filter(document_id__in=options['ids'])
+            existing = existing.filter(document_id__in=options['ids'])
+
+        # one query for every derivative that already exists, rather than one per page
+        existing = set(existing.values_list('document_id', 'page_number', 'scale'))
+        pending = []
+        for source in sources:
+            # screen images no wider than a scale never get it, so they're only downloaded while their width is unknown
+            missing = [scale for scale in scales if (source.document_id, source.page_number, scale) not in existing
+                and (source.width is None or source.width > WIDTHS[scale])]
+            if missing:
+                pending.append((source, missing))
+        print('Generating images for', len(pending), 'pages')
+
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            for n in range(0, len(pending), options['chunk_size']):
+                self.generate(pending[n:n + options['chunk_size']], pool, options['format'])
+                print('Generated images for', min(n + options['chunk_size'], len(pending)), 'pages')
+
+    def generate(self, pending, pool, image_format):
+        results = pool.map(make_derivatives,
+            [source.source_url() for (source, scales) in pending],
+            [source.url.rsplit('/', 1)[-1].rsplit('.', 1)[0] for (source, scales) in pending],
+            [scales for (source, scales) in pending],
+            repeat(image_format))
+
+        images = []
+        sized = []
+        for ((source, scales), result) in zip(pending, results):
+            if result is None:
+                print("couldn't generate images for", source.url)
+                continue
+            (size, derivatives) = result
+            if (source.width, source.height) != size:
+                (source.width, source.height) = size
+                sized.append(source)
+            for (scale, url, width, height) in derivatives:
+                images.append(DocumentImage(document_id=source.document_id, page_number=source.page_number,
+                    physical_page_number=source.physical_page_number, image_type_id=source.image_type_id,
+                    scale=scale, url=url, width=width, height=height))
+
+        with transaction.atomic():
+            DocumentImage.objects.bulk_create(images, batch_size=500)
+            # record screen sizes, so pages too narrow for a scale aren't downloaded again
+            DocumentImage.objects.bulk_update(sized, ['width', 'height'], batch_size=500)
+        for document_id in sorted({image.document_id for image in images + sized}):
+            write_manifest(Document(id=document_id))
+
+
+@lru_cache(maxsize=None)
+def document_image_storage():
+    return get_storage_class(settings.DOCUMENT_IMAGE_STORAGE['BACKEND'])(**settings.DOCUMENT_IMAGE_STORAGE.get('OPTIONS', {}))
+
+
+@receiver(setting_changed)
+def reset_document_image_storage(setting, **kwargs):
+    if setting == 'DOCUMENT_IMAGE_STORAGE':
+        document_image_storage.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def session():
+    return requests.Session()
+
+
+def make_derivatives(source_url, name, scales, image_format):
+    """
+    Runs in a worker process: resizes the image at `source_url` to each of `scales`,
+    saves the results to DOCUMENT_IMAGE_STORAGE and returns ((width, height), [(scale, url, width, height)])
+    with the size of the source image, or None if it can't be read, resized or saved.
+    Scales at least as wide as the image are skipped.
+    """
+    try:
+        return resize_and_save(source_url, name, scales, image_format)
+    except Exception as error:
+        # an exception would be raised again by pool.map, ending the whole run for one bad image
+        print("couldn't generate images from", source_url, repr(error))
+        return None
+
+
+def resize_and_save(source_url, name, scales, image_format):
+    data = read_file(source_url, session())
+    if not data:
+        return None
+    try:
+        image = Image.open(BytesIO(data))
+        (source_width, source_height) = image.size
+        # JPEGs can be decoded at a fraction of their size, no smaller than the widest image needed
+        widest = max(WIDTHS[scale] for scale in scales)
+        image.draft(image.mode, (widest, round(source_height * widest / source_width)))
+        image.load()
+    except OSError:
+        return None
+    if image.mode not in ('L', 'RGB'):
+        image = image.convert('RGB')
+
+    storage = document_image_storage()
+    (pil_format, extension) = FORMATS[image_format]
+    derivatives = []
+    for scale in scales:
+        width = WIDTHS[scale]
+        if source_width <= width:
+            continue
+        height = round(source_height * width / source_width)
+        output = BytesIO()
+        image.resize((width, height), Image.LANCZOS).save(output, pil_format, quality=80)
+
+        path = 'derivatives/{}/{}.{}'.format(SCALE_NAMES[scale], name, extension)
+        if storage.exists(path):
+            storage.delete(path)
+        path = storage.save(path, ContentFile(output.getvalue()))
+        # served by the image proxy, from the bucket at DOCUMENTS_URL
+        derivatives.append((scale, '/proxy_image/' + path, width, height))
+    return ((source_width, source_height), derivatives)
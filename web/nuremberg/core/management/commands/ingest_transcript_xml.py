@@ -1,9 +1,15 @@
-from os import path, listdir
+from os import path, listdir, replace
+import json
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from io import BytesIO, SEEK_CUR
+import sys
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
 from nuremberg.documents.models import DocumentCase
 from nuremberg.transcripts.models import Transcript, TranscriptPage
 
@@ -12,70 +18,262 @@ class Command(BaseCommand):
 
     filename_re = re.compile(r'^NRMB-(?P<case_label>[A-Z]+)(?P<case_number>\d{2})?-(?P<volume>\d{2})_(?P<vol_seq>\d{5})_[01]\.xml$')
 
+    # fields written for pages that already exist
+    update_fields = ['xml', 'xml_hash', 'image_url', 'seq_number', 'date', 'page_number', 'page_label',
+        'extracted_text', 'extracted_evidence_codes', 'extracted_exhibit_codes', 'updated_at']
+
     def add_arguments(self, parser):
-        parser.add_argument('paths', nargs='+', type=str, help='XML files to ingest')
+        parser.add_argument('paths', nargs='+', type=str, help='XML files, or zip or tar archives of XML files, to ingest. Use - to read a tar archive from stdin.')
         parser.add_argument('-d', action='store_true', default=False, help='Injest every XML file in the provided directories.')
-        parser.add_argument('-s', default=None, type=int, help='Skip N files before ingesting.')
+        parser.add_argument('--checkpoint', default=None, type=str, help='File recording progress through each path, to resume an interrupted ingest.')
+        parser.add_argument('--stdin-name', default=None, type=str, help='Name to record progress through stdin under in the checkpoint, e.g. the name of the archive piped in.')
+        parser.add_argument('--batch-size', default=500, type=int, help='Number of pages saved per transaction.')
+        parser.add_argument('--workers', default=1, type=int, help='Number of processes used to parse XML.')
+        parser.add_argument('--force', action='store_true', default=False, help='Re-ingest pages even if their XML is unchanged.')
 
     def handle(self, *args, **options):
-        count = 0
-        if options['d']:
-            paths = []
-            for dirname in options['paths']:
-                paths += [path.join(dirname, name) for name in listdir(dirname)]
+        self.checkpoint_path = options['checkpoint']
+        self.stdin_name = options['stdin_name']
+        if self.checkpoint_path and '-' in options['paths'] and not self.stdin_name:
+            # the checkpoint can't tell one stream from another
+            raise CommandError('Name the archive read from stdin with --stdin-name to checkpoint it.')
+        # where the interrupted run stopped; never changed, unlike `position`, which tracks this run
+        self.resume_from = {}
+        if self.checkpoint_path and path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as file:
+                self.resume_from = json.load(file)
+            print('Resuming from', self.checkpoint_path)
+        self.position = {}
+        self.streamed_sources = set()
+        self.resumed_sources = set()
+
+        print('Ingesting', ' '.join(options['paths']))
+
+        # lookups are cached for the whole run, since pages arrive grouped by case and volume
+        self.transcripts = {}
+        self.volumes = {}
+        self.volume_pages = {}
+        self.force = options['force']
+        self.skipped = 0
+
+        if options['workers'] > 1:
+            # workers only parse XML, all database access stays in this process
+            self.pool = ProcessPoolExecutor(max_workers=options['workers'])
         else:
-            paths = options['paths']
-        if options['s']:
-            print('Skipping', options['s'], 'files.')
-            paths = paths[options['s']:]
-        print('Ingesting', len(paths), 'files.')
-        for file_path in paths:
-            if not path.exists(file_path):
-                print("No such file:", filename)
+            self.pool = None
+
+        count = 0
+        start = time.time()
+        batch = {}
+        try:
+            for (source, name, file_path, read) in self.iter_files(options['paths'], options['d']):
+                if self.is_checkpointed(source, name):
+                    continue
+                self.position[source] = name
+                page = self.read_page(file_path, read)
+                if not page:
+                    continue
+                # if a page appears twice, the last file wins
+                batch[(page.volume.id, page.volume_seq_number)] = (file_path, page)
+                if len(batch) >= options['batch_size']:
+                    count += self.save_batch(list(batch.values()))
+                    self.save_checkpoint()
+                    batch = {}
+                    print('Ingested', count, 'pages ({:.1f} pages/sec).'.format(count / (time.time() - start)))
+            if batch:
+                count += self.save_batch(list(batch.values()))
+            self.save_checkpoint()
+        finally:
+            if self.pool:
+                self.pool.shutdown()
+
+        print('Ingested', count, 'pages in {:.1f} seconds.'.format(time.time() - start))
+        if self.skipped:
+            print('Skipped', self.skipped, 'unchanged pages.')
+
+    def iter_files(self, paths, directories):
+        """
+        Yields (source, name, file_path, read) for each file to ingest, where `read()` returns the file's XML.
+        Directories and zip archives are listed in sorted order, so that checkpoints don't depend on listing order.
+        Tar archives are streamed one member at a time, so `read` must be called before moving on.
+        """
+        for source in paths:
+            if source == '-':
+                yield from self.iter_tar('stdin:{}'.format(self.stdin_name) if self.stdin_name else 'stdin',
+                    tarfile.open(fileobj=sys.stdin.buffer, mode='r|*'))
                 continue
 
-            filename = path.basename(file_path)
-            m = self.filename_re.match(filename)
-            if not m:
-                print("Don't know how to process this:", filename)
+            if not path.exists(source):
+                print("No such file:", source)
                 continue
 
-            # sketchily get case ID
-            if m.group('case_label') == 'NMT':
-                case_id = int(m.group('case_number')) + 1
-            elif m.group('case_label') == 'IMT':
-                case_id = 1
+            source = path.abspath(source)
+            if path.isdir(source):
+                if not directories:
+                    print("Skipping directory (use -d to ingest it):", source)
+                    continue
+                for name in sorted(listdir(source)):
+                    yield (source, name, path.join(source, name), self.file_reader(path.join(source, name)))
+            elif source.endswith('.xml'):
+                yield (source, path.basename(source), source, self.file_reader(source))
+            elif zipfile.is_zipfile(source):
+                with zipfile.ZipFile(source) as archive:
+                    for member in sorted(archive.infolist(), key=lambda member: member.filename):
+                        if not member.is_dir():
+                            yield (source, member.filename, '{}:{}'.format(source, member.filename),
+                                lambda member=member: archive.read(member).decode('utf8'))
+            elif tarfile.is_tarfile(source):
+                with tarfile.open(source, mode='r|*') as archive:
+                    yield from self.iter_tar(source, archive)
             else:
-                print("I don't know a case called",m.group('case_label'))
-                continue
+                yield (source, path.basename(source), source, self.file_reader(source))
+
+    def iter_tar(self, source, archive):
+        self.streamed_sources.add(source)
+        for member in archive:
+            if member.isfile():
+                yield (source, member.name, '{}:{}'.format(source, member.name),
+                    lambda member=member: archive.extractfile(member).read().decode('utf8'))
+        if self.resume_from.get(source) and source not in self.resumed_sources:
+            # every member was skipped waiting for one that isn't there, so this isn't the archive that was checkpointed
+            raise CommandError('{} has no member {}, where the checkpoint says to resume. '
+                'Remove it from {} to ingest the archive from the start.'.format(source, self.resume_from[source], self.checkpoint_path))
+
+    def is_checkpointed(self, source, name):
+        """
+        Whether a file was already ingested according to the checkpoint.
+        """
+        last = self.resume_from.get(source)
+        if not last or source in self.resumed_sources:
+            return False
+        if source in self.streamed_sources:
+            # tar members can't be sorted, but their order is fixed, so skip up to the last one ingested
+            if name == last:
+                self.resumed_sources.add(source)
+            return True
+        return name <= last
+
+    def save_checkpoint(self):
+        """
+        Records the last file read from each source. Called only after a batch is committed,
+        at which point every file read so far has been saved or skipped.
+        Sources this run hasn't reached yet keep the position they were resumed from.
+        """
+        if not self.checkpoint_path:
+            return
+        checkpoint = dict(self.resume_from, **self.position)
+        with open(self.checkpoint_path + '.tmp', 'w') as file:
+            json.dump(checkpoint, file, indent=2)
+        replace(self.checkpoint_path + '.tmp', self.checkpoint_path)
+
+    def file_reader(self, file_path):
+        def read():
+            with open(file_path, 'r') as file:
+                return file.read()
+        return read
+
+    def read_page(self, file_path, read):
+        """
+        Reads a file into an unsaved TranscriptPage, without parsing it.
+        """
+        # archive members are labeled archive:member
+        filename = path.basename(file_path.rsplit(':', 1)[-1])
+        m = self.filename_re.match(filename)
+        if not m:
+            print("Don't know how to process this:", filename)
+            return
 
+        # sketchily get case ID
+        if m.group('case_label') == 'NMT':
+            case_id = int(m.group('case_number')) + 1
+        elif m.group('case_label') == 'IMT':
+            case_id = 1
+        else:
+            print("I don't know a case called",m.group('case_label'))
+            return
+
+        transcript = self.get_transcript(case_id)
+        volume = self.get_volume(transcript, int(m.group('volume')))
+
+        volume_seq_number = int(m.group('vol_seq'))
+        xml = read()
+
+        (page_id, xml_hash) = self.volume_pages[volume.id].get(volume_seq_number, (None, None))
+        if page_id and not self.force and xml_hash == TranscriptPage.hash_xml(xml):
+            # leave updated_at alone, so unchanged pages aren't reindexed
+            self.skipped += 1
+            return
+
+        page = TranscriptPage(id=page_id,
+            transcript=transcript, volume=volume, volume_seq_number=volume_seq_number)
+        page.xml = xml
+        page.image_url = "//s3.amazonaws.com/nuremberg-transcripts/{}".format(filename.replace('.xml', '.jpg'))
+        return page
+
+    def get_transcript(self, case_id):
+        if case_id not in self.transcripts:
             case = DocumentCase.objects.get(pk=case_id)
             try:
                 transcript = case.transcript
             except Transcript.DoesNotExist:
                 transcript = Transcript.objects.create(case=case, title="Transcript for {}".format(case.short_name()))
                 print("Created transcript", transcript.title)
+            self.transcripts[case_id] = transcript
+        return self.transcripts[case_id]
 
-            volume_number = int(m.group('volume'))
-
+    def get_volume(self, transcript, volume_number):
+        key = (transcript.id, volume_number)
+        if key not in self.volumes:
             volume = transcript.volumes.filter(volume_number=volume_number).first()
             if not volume:
                 volume = transcript.volumes.create(volume_number=volume_number)
                 print("Created transcript volume", transcript.title, volume.volume_number)
+            self.volumes[key] = volume
+            self.volume_pages[volume.id] = {volume_seq_number: (page_id, xml_hash) for (volume_seq_number, page_id, xml_hash)
+                in volume.pages.values_list('volume_seq_number', 'id', 'xml_hash')}
+        return self.volumes[key]
 
-            volume_seq_number = int(m.group('vol_seq'))
-            page = volume.pages.filter(volume_seq_number=volume_seq_number).first()
-            with open(file_path, 'r') as file:
-                xml = file.read()
-            if not page:
-                page = TranscriptPage( transcript=transcript, volume=volume, volume_seq_number=volume_seq_number)
-            page.xml = xml
-            page.image_url = "//s3.amazonaws.com/nuremberg-transcripts/{}".format(filename.replace('.xml', '.jpg'))
+    def save_batch(self, batch):
+        if self.pool:
+            extracted = [self.pool.submit(extract_xml, page.xml) for (file_path, page) in batch]
+        else:
+            extracted = None
+
+        # existing pages are updated in place, so fields missing from the new XML keep their values
+        existing = TranscriptPage.objects.defer('xml', 'extracted_text').in_bulk([page.id for (file_path, page) in batch if page.id])
+        now = timezone.now()
+        new_pages = []
+        updated_pages = []
+        for n, (file_path, page) in enumerate(batch):
+            if page.id:
+                page = existing[page.id]
+                page.xml = batch[n][1].xml
+                page.image_url = batch[n][1].image_url
             try:
-                page.populate_from_xml()
+                page.populate_from_xml(extracted[n].result() if extracted else None)
             except Exception as e:
                 print('error populating page', file_path)
                 raise e
-            page.save()
-            count += 1
-            if count % 100 == 0: print('Created', count, 'pages.')
+            if page.id:
+                page.updated_at = now
+                updated_pages.append(page)
+            else:
+                new_pages.append(page)
+
+        with transaction.atomic():
+            TranscriptPage.objects.bulk_create(new_pages)
+            TranscriptPage.objects.bulk_update(updated_pages, self.update_fields)
+
+        # not every database returns ids from bulk_create, so look them up for later batches
+        for volume_id in {page.volume.id for page in new_pages}:
+            for (volume_seq_number, page_id, xml_hash) in TranscriptPage.objects.filter(volume_id=volume_id,
+                volume_seq_number__in=[page.volume_seq_number for page in new_pages if page.volume.id == volume_id]) \
+                .values_list('volume_seq_number', 'id', 'xml_hash'):
+                self.volume_pages[volume_id][volume_seq_number] = (page_id, xml_hash)
+        for page in updated_pages:
+            self.volume_pages[page.volume_id][page.volume_seq_number] = (page.id, page.xml_hash)
+
+        return len(batch)
+
+def extract_xml(xml):
+    return TranscriptPage(xml=xml).extract()
@@ -0,0 +1,85 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain
+from os import cpu_count
+
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from nuremberg.transcripts.models import Transcript, TranscriptRender
+from nuremberg.transcripts.views import Show
+
+
+class Command(BaseCommand):
+    help = 'Pre-renders every seq range the transcript viewer loads or scrolls to, so it never has to parse XML'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', nargs='+', type=int, default=None, help='Transcript ids to pre-render (default is all transcripts)')
+        parser.add_argument('--workers', type=int, default=cpu_count(), help='Number of rendering processes.')
+        parser.add_argument('--chunk-size', type=int, default=50, help='Number of seq ranges rendered per task.')
+
+    def handle(self, *args, **options):
+        transcripts = Transcript.objects.all()
+        if options['ids']:
+            transcripts = transcripts.filter(id__in=options['ids'])
+
+        tasks = []
+        for transcript in transcripts:
+            stale = stale_ranges(transcript)
+            print('Transcript', transcript.id, 'has', len(stale), 'ranges to render.')
+            for n in range(0, len(stale), options['chunk_size']):
+                tasks.append((transcript.id, stale[n:n + options['chunk_size']]))
+
+        if not tasks:
+            print('Nothing to render.')
+            return
+
+        # forked workers must not share the parent's database connections
+        connections.close_all()
+
+        count = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            futures = [pool.submit(render_ranges, transcript_id, ranges) for (transcript_id, ranges) in tasks]
+            for future in as_completed(futures):
+                # every finished chunk is saved right away, so an interrupted run can simply be restarted
+                with transaction.atomic():
+                    for (transcript_id, render) in future.result():
+                        TranscriptRender.objects.update_or_create(transcript_id=transcript_id,
+                            from_seq=render.from_seq, to_seq=render.to_seq,
+                            defaults={field: getattr(render, field) for field in
+                                ('total_pages', 'pages_updated_at', 'joined_from_seq', 'joined_to_seq', 'html')})
+                        count += 1
+                print('Rendered', count, 'ranges.')
+
+
+def stale_ranges(transcript):
+    """
+    Returns a list of (from_seq, to_seq, pages_updated_at) for each range the viewer requests
+    that has no render, or whose pages have been updated since it was rendered.
+    """
+    page_updates = dict(transcript.pages.values_list('seq_number', 'updated_at'))
+    renders = {(render.from_seq, render.to_seq): render for render in
+        transcript.renders.defer('html')}
+
+    stale = []
+    ranges = chain(transcript.aligned_seq_ranges(Show.page_alignment), transcript.scroll_seq_ranges(Show.page_alignment))
+    # ranges near the ends of a transcript can coincide once clamped
+    for (from_seq, to_seq) in dict.fromkeys(ranges):
+        updates = [page_updates[seq] for seq in range(from_seq, to_seq + 1) if seq in page_updates]
+        if not updates:
+            continue
+        pages_updated_at = max(updates)
+        render = renders.get((from_seq, to_seq))
+        if render and render.total_pages == transcript.total_pages and render.pages_updated_at >= pages_updated_at:
+            continue
+        stale.append((from_seq, to_seq, pages_updated_at))
+    return stale
+
+
+def render_ranges(transcript_id, ranges):
+    transcript = Transcript.objects.get(id=transcript_id)
+    renders = []
+    for (from_seq, to_seq, pages_updated_at) in ranges:
+        render = TranscriptRender(from_seq=from_seq, to_seq=to_seq,
+            total_pages=transcript.total_pages, pages_updated_at=pages_updated_at)
+        render.set_joined(transcript.render_pages(from_seq, to_seq))
+        renders.append((transcript_id, render))
+    return renders
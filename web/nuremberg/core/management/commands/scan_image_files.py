@@ -1,44 +1,85 @@
 import requests, re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from io import BytesIO, SEEK_CUR
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 from django.core.management.base import BaseCommand
-from nuremberg.documents.models import Document, DocumentImage, DocumentImageType
+from django.db import transaction
+from nuremberg.documents.image_size import get_image_size
+from nuremberg.documents.manifests import write_manifest
+from nuremberg.documents.models import IMAGE_URL_ROOT, Document, DocumentImage, DocumentImageType, OldDocumentImage
 
 class Command(BaseCommand):
     help = 'Populates the DocumentImage metadata for any missing images'
 
     def add_arguments(self, parser):
         parser.add_argument('--ids', nargs='+', type=int, default=None, help='Document ids to scan for missing images (default is all documents)')
+        parser.add_argument('--workers', type=int, default=20, help='Maximum number of image requests in flight at once.')
+        parser.add_argument('--chunk-size', type=int, default=200, help='Number of documents scanned and saved at a time.')
+        parser.add_argument('--url-root', type=str, default=IMAGE_URL_ROOT, help='URL of the image directory (e.g. a local minio bucket).')
 
     def handle(self, *args, **options):
-        documents = Document.objects
+        documents = Document.objects.filter(image_count__gt=0).order_by('id').only('id', 'image_count')
+        existing = DocumentImage.objects.all()
         if options['ids']:
             documents = documents.filter(id__in=options['ids'])
-        else:
-            documents = documents.all()
-
-        with ThreadPoolExecutor(max_workers=10) as pool:
-            for document in documents:
-                if document.image_count and document.images.count() < document.image_count:
-                    pool.submit(populate_document, document)
-                else:
-                    print("skipping document",document.id)
-
-def populate_document(document):
-    print("Populating", document.id, document.image_count)
-    with ThreadPoolExecutor(max_workers=10) as pool:
-        for page_number in range(1, document.image_count + 1):
-            if not document.images.filter(page_number=page_number).exists():
-                pool.submit(populate_metadata, document, page_number)
-    print("Populated", document.id, document.image_count)
-
-
-def populate_metadata(document, page_number):
+            existing = existing.filter(document_id__in=options['ids'])
+
+        # one query for every page that already has an image, rather than one per page
+        existing = set(existing.values_list('document_id', 'page_number'))
+        missing = []
+        for document in documents:
+            pages = [page_number for page_number in document.page_range() if (document.id, page_number) not in existing]
+            if pages:
+                missing.append((document, pages))
+            else:
+                print("skipping document", document.id)
+
+        self.default_image_type = DocumentImageType.objects.get(id=4)
+
+        # a single pool bounds concurrency across all documents, and the session keeps connections alive between requests
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=options['workers']))
+        session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=options['workers']))
+        with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+            for n in range(0, len(missing), options['chunk_size']):
+                self.populate_documents(missing[n:n + options['chunk_size']], session, pool, options['url_root'])
+
+    def populate_documents(self, missing, session, pool, url_root):
+        old_images = {(old_image.document_id, old_image.filename): old_image for old_image in
+            OldDocumentImage.objects.filter(document_id__in=[document.id for (document, pages) in missing]).select_related('image_type')}
+
+        images = []
+        sizes = []
+        for (document, pages) in missing:
+            print("Populating", document.id, document.image_count)
+            for page_number in pages:
+                image = build_image(document, page_number, old_images, self.default_image_type, url_root)
+                images.append(image)
+                sizes.append(pool.submit(get_image_size, image.url, session=session))
+
+        for (image, size) in zip(images, sizes):
+            try:
+                (image.width, image.height) = size.result()
+            except Exception as e:
+                # e.g. a truncated or corrupt header; one bad image shouldn't lose the rest of the chunk
+                print("error reading image size", image.url, e)
+                (image.width, image.height) = (None, None)
+            if not (image.width and image.height):
+                print("couldn't read image size", image.url)
+                image.url = None
+
+        with transaction.atomic():
+            DocumentImage.objects.bulk_create(images, batch_size=500)
+        for (document, pages) in missing:
+            write_manifest(document)
+            print("Populated", document.id, document.image_count)
+
+
+def build_image(document, page_number, old_images, default_image_type, url_root=IMAGE_URL_ROOT):
     image = DocumentImage(document=document, page_number=page_number)
 
     filename = "{:05d}{:03d}".format(document.id, page_number)
-    old_image = document.old_images.filter(filename=filename).first()
+    old_image = old_images.get((document.id, filename))
 
     if old_image:
         if old_image.physical_page_number:
@@ -48,43 +89,8 @@ def populate_metadata(document, page_number):
 
         image.image_type = old_image.image_type
     else:
-        image.image_type = DocumentImageType.objects.get(id=4)
+        image.image_type = default_image_type
 
-    image.url = "http://nuremberg.law.harvard.edu/imagedir/HLSL_NMT01/HLSL_NUR_{}.jpg".format(filename)
-    (image.width, image.height) = get_jpeg_size(image.url)
+    image.url = "{}/HLSL_NUR_{}.jpg".format(url_root.rstrip('/'), filename)
     image.scale = DocumentImage.SCREEN
-    if not (image.width and image.height):
-        image.url = None
-    image.save()
-
-def get_jpeg_size(url, header_length=5000):
-    header = requests.get(url, headers={'Range': 'bytes=0-{}'.format(header_length)})
-
-
-    data = BytesIO(header.content)
-
-    if data.read(2) != b'\xFF\xD8':
-        print("not a valid JPEG file ", url, header.content)
-        return (None, None)
-
-    # scan the JFIF header for the SOF0 block with image dimensions in it
-    while True:
-        block_header = data.read(2)
-        block_size = int.from_bytes(data.read(2), byteorder="big")
-        if block_header == b'\xFF\xc0': # found SOF0
-            break
-        if block_header == b'':
-            if header_length and header_length < 50000:
-                return get_jpeg_size(url, header_length + 25000)
-            elif header_length:
-                return get_jpeg_size(url, '')
-
-            print("ran out of bytes in JPEG header", url, "after", len(header.content))
-            raise Exception("out of bytes")
-        data.seek(block_size - 2, SEEK_CUR) # size includes size bytes
-
-    data.read(1)
-
-    height = int.from_bytes(data.read(2), byteorder="big")
-    width = int.from_bytes(data.read(2), byteorder="big")
-    return (width, height)
+    return image
@@ -0,0 +1,38 @@
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.urls import reverse
+from nuremberg.documents.models import Document
+from nuremberg.documents.views import Show
+
+
+class Command(BaseCommand):
+    help = 'Renders the cached fragments of every document page, so the first visitor to a document doesn\'t have to'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', nargs='+', type=int, default=None, help='Document ids to render (default is all documents)')
+        parser.add_argument('--force', action='store_true', default=False, help='Re-render documents that are already cached.')
+
+    def handle(self, *args, **options):
+        documents = Document.objects.order_by('id')
+        if options['ids']:
+            documents = documents.filter(id__in=options['ids'])
+
+        view = Show.as_view()
+        factory = RequestFactory()
+        rendered = 0
+        for document in documents.iterator():
+            cache_version = document.cache_version()
+            if options['force']:
+                caches['persistent'].delete_many(Show.fragment_keys(document, cache_version))
+            elif Show.is_cached(document, cache_version):
+                continue
+
+            path = reverse('documents:show', kwargs={'document_id': document.id})
+            # rendering the page stores its fragments
+            view(factory.get(path), document_id=document.id)
+            rendered += 1
+            if rendered % 100 == 0:
+                print('Rendered', rendered, 'documents.')
+
+        print('Rendered', rendered, 'documents.')
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from nuremberg.documents.manifests import document_storage, manifest_path, write_manifest
+from nuremberg.documents.models import Document
+
+
+class Command(BaseCommand):
+    help = 'Writes the image manifest of every document to DOCUMENT_STORAGE, so document pages don\'t have to query their images'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', nargs='+', type=int, default=None, help='Document ids to write manifests for (default is all documents)')
+        parser.add_argument('--missing', action='store_true', default=False, help='Only write manifests that don\'t exist yet.')
+
+    def handle(self, *args, **options):
+        documents = Document.objects.order_by('id').only('id')
+        if options['ids']:
+            documents = documents.filter(id__in=options['ids'])
+
+        storage = document_storage()
+        count = 0
+        for document in documents.iterator():
+            if options['missing'] and storage.exists(manifest_path(document.id)):
+                continue
+            write_manifest(document)
+            count += 1
+            if count % 1000 == 0:
+                print('Wrote', count, 'manifests.')
+
+        print('Wrote', count, 'manifests.')
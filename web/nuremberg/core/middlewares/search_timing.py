@@ -0,0 +1,35 @@
+import time
+from nuremberg.search.timing import logger, request_searches, summarize, format_stats, milliseconds
+
+
+class SearchTimingMiddleware:
+    """
+    Sums up the Solr searches made while handling each request (see nuremberg.search.timing)
+    in a Server-Timing header, which browser developer tools show beside the request,
+    and an INFO log record. Solr time, result processing time and the total leave the rest,
+    such as template rendering, to subtract.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        searches = []
+        token = request_searches.set(searches)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            request_searches.reset(token)
+
+        if searches:
+            summary = summarize(searches)
+            summary['total_ms'] = milliseconds(time.perf_counter() - started)
+            response['Server-Timing'] = ', '.join([
+                'solr;dur={solr_ms};desc="Solr: {searches} queries, {cached} cached, {bytes} bytes"',
+                'solr-qtime;dur={qtime_ms};desc="Solr QTime"',
+                'solr-results;dur={process_ms};desc="Processing {groups} result groups"',
+                'total;dur={total_ms}',
+            ]).format(**summary)
+            logger.info('Solr queries for %s: %s', request.get_full_path(), format_stats(summary),
+                extra={'solr': summary})
+        return response
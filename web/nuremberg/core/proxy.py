@@ -0,0 +1,240 @@
+"""
+Streams document and transcript images from the image buckets (see DOCUMENTS_URL and TRANSCRIPTS_URL).
+
+Bodies are passed through in chunks as they arrive, conditional requests are forwarded
+so browsers can revalidate without a transfer, and small images (mostly the thumbnails
+on search result pages) are kept in a bounded on-disk cache, evicting the least
+recently served first.
+"""
+import json
+import os
+import requests
+import time
+from functools import lru_cache
+from hashlib import sha1
+from tempfile import NamedTemporaryFile
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import reverse
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotAllowed, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import parse_http_date_safe
+from django.views.decorators.csrf import csrf_exempt
+
+CHUNK_SIZE = 64 * 1024
+# request headers passed upstream, so the bucket can answer 304 or a partial response
+FORWARDED_HEADERS = ('If-None-Match', 'If-Modified-Since', 'Range', 'If-Range')
+# response headers passed back to the client
+RETURNED_HEADERS = ('Content-Type', 'Content-Length', 'Content-Encoding', 'Content-Range', 'Accept-Ranges', 'ETag', 'Last-Modified')
+
+# shared by every proxied request in this process, so connections to the bucket are reused
+session = requests.Session()
+
+
+@lru_cache(maxsize=None)
+def proxy_prefix(name):
+    """
+    The path of the proxy view `name`, to which an image path is appended.
+    Reversed once, so building proxied URLs costs a string concatenation.
+    """
+    return reverse(name, kwargs={'path': ''})
+
+
+def proxied(base_url, accel_location):
+    """
+    A view proxying `path` under `base_url`, or with settings.PROXY_ACCEL_REDIRECT,
+    handing it to nginx at the internal `accel_location` that proxies `base_url`
+    (if there is one).
+    """
+    @csrf_exempt
+    def proxy_handler(request, path):
+        if request.method not in ('GET', 'HEAD'):
+            return HttpResponseNotAllowed(['GET', 'HEAD'])
+        # keep requests inside the bucket, however they're served
+        if '..' in path.split('/'):
+            raise Http404()
+        if settings.PROXY_ACCEL_REDIRECT and accel_location:
+            return accel_redirect(accel_location, path)
+        return proxy_view(request, base_url + path)
+    return proxy_handler
+
+
+def accel_redirect(location, path):
+    """
+    Has nginx serve `path` from the internal `location` (see nginx.conf), which
+    fetches and caches it, conditional requests included, without tying up a worker.
+    """
+    response = HttpResponse()
+    response['X-Accel-Redirect'] = location + quote(path)
+    # nginx keeps the Content-Type of this response over the image's unless it's removed
+    del response['Content-Type']
+    return response
+
+
+def proxy_view(request, url):
+    # only whole images are cached, so partial requests always go to the bucket
+    cache = proxy_cache() if 'Range' not in request.headers else None
+    if cache:
+        entry = cache.get(url)
+        if entry:
+            return cached_response(request, *entry)
+
+    headers = {header: request.headers[header] for header in FORWARDED_HEADERS if header in request.headers}
+    try:
+        upstream = session.request(request.method, url, headers=headers, stream=True, timeout=settings.PROXY_TIMEOUT)
+    except requests.RequestException:
+        return HttpResponse(status=502)
+
+    if upstream.status_code == 304 or request.method == 'HEAD':
+        upstream.close()
+        response = HttpResponse(status=upstream.status_code)
+    else:
+        # passed through as sent, so Content-Length and Content-Encoding still describe it
+        body = upstream.raw.stream(CHUNK_SIZE, decode_content=False)
+        length = int(upstream.headers.get('Content-Length') or -1)
+        if cache and upstream.status_code == 200 and 0 <= length <= cache.max_file_size:
+            body = cache.save_as_streamed(url, body, {header: upstream.headers[header] for header in RETURNED_HEADERS if header in upstream.headers})
+        response = StreamingHttpResponse(closing(body, upstream), status=upstream.status_code)
+
+    for header in RETURNED_HEADERS:
+        if header in upstream.headers:
+            response[header] = upstream.headers[header]
+    if upstream.status_code in (200, 206, 304):
+        patch_cache_control(response, public=True, max_age=settings.PROXY_MAX_AGE)
+    return response
+
+
+def closing(body, upstream):
+    # releases the upstream connection even if the client goes away mid-transfer
+    try:
+        yield from body
+    finally:
+        upstream.close()
+
+
+def cached_response(request, path, headers):
+    response = get_conditional_response(request,
+        etag=headers.get('ETag'),
+        last_modified=parse_http_date_safe(headers.get('Last-Modified', '')))
+    if response is None:
+        response = FileResponse(open(path, 'rb'))
+        for (header, value) in headers.items():
+            response[header] = value
+    else:
+        for header in ('ETag', 'Last-Modified'):
+            if header in headers:
+                response[header] = headers[header]
+    patch_cache_control(response, public=True, max_age=settings.PROXY_MAX_AGE)
+    return response
+
+
+@lru_cache(maxsize=None)
+def proxy_cache():
+    """
+    The DiskLRU configured by settings.PROXY_CACHE, or None if it's disabled.
+    """
+    if settings.PROXY_CACHE:
+        return DiskLRU(settings.PROXY_CACHE['LOCATION'], settings.PROXY_CACHE['MAX_SIZE'], settings.PROXY_CACHE['MAX_FILE_SIZE'],
+            settings.PROXY_MAX_AGE)
+
+
+@receiver(setting_changed)
+def reset_proxy_cache(setting, **kwargs):
+    if setting in ('PROXY_CACHE', 'PROXY_MAX_AGE'):
+        proxy_cache.cache_clear()
+
+
+class DiskLRU:
+    """
+    Response bodies kept as files in `location`, each beside a JSON file of its headers
+    and when it was fetched, with the files' modification times recording when each was
+    last served. Entries fetched more than `max_age` seconds ago are fetched again, as
+    browsers holding them would be.
+
+    Once the files add up to more than `max_size` bytes, the least recently served
+    are removed until they take up 90% of it. Each process keeps a running total
+    of what it has added, and recounts the directory when that total goes over.
+    """
+    def __init__(self, location, max_size, max_file_size, max_age=None):
+        self.location = location
+        self.max_size = max_size
+        self.max_file_size = max_file_size
+        self.max_age = max_age
+        self.size = None
+
+    def path(self, url):
+        digest = sha1(url.encode('utf8')).hexdigest()
+        return os.path.join(self.location, digest[:2], digest)
+
+    def get(self, url):
+        """
+        Returns (body path, headers) for a cached url, or None if it isn't cached or has expired.
+        """
+        path = self.path(url)
+        try:
+            with open(path + '.json') as file:
+                meta = json.load(file)
+            (fetched, headers) = (meta['fetched'], meta['headers'])
+            if self.max_age is not None and time.time() - fetched > self.max_age:
+                return None
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            # missing, or saved before fetch times were recorded
+            return None
+        return (path, headers)
+
+    def save_as_streamed(self, url, chunks, headers):
+        """
+        Passes `chunks` through, saving them once the last one is read.
+        """
+        fetched = time.time()
+        path = self.path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as file:
+            try:
+                for chunk in chunks:
+                    file.write(chunk)
+                    yield chunk
+            except BaseException:
+                file.close()
+                os.remove(file.name)
+                raise
+        # entries are looked up by their headers, so those are written once the body is in place
+        os.replace(file.name, path)
+        with open(path + '.json', 'w') as meta:
+            json.dump({'fetched': fetched, 'headers': headers}, meta)
+        self.added(os.path.getsize(path))
+
+    def added(self, size):
+        if self.size is None:
+            self.size = self.count()
+        else:
+            self.size += size
+        if self.size > self.max_size:
+            self.evict()
+
+    def entries(self):
+        for directory in os.scandir(self.location):
+            if directory.is_dir():
+                for entry in os.scandir(directory.path):
+                    if not entry.name.endswith('.json') and not entry.name.startswith('tmp'):
+                        yield entry
+
+    def count(self):
+        return sum(entry.stat().st_size for entry in self.entries())
+
+    def evict(self):
+        entries = sorted(((entry.stat(), entry.path) for entry in self.entries()), key=lambda entry: entry[0].st_mtime)
+        self.size = sum(stat.st_size for (stat, path) in entries)
+        for (stat, path) in entries:
+            if self.size <= self.max_size * 0.9:
+                break
+            for name in (path + '.json', path):
+                try:
+                    os.remove(name)
+                except OSError:
+                    pass
+            self.size -= stat.st_size
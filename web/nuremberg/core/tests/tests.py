@@ -5,3 +5,111 @@ def test_404():
     page = PyQuery(response.content)
 
     assert "can't find" in page('h1').text()
+
+
+def test_proxy_cache(tmp_path):
+    import json
+    import os
+    import time
+    from nuremberg.core.proxy import DiskLRU
+
+    cache = DiskLRU(str(tmp_path), max_size=130, max_file_size=50)
+    assert cache.get('http://images/1.jpg') is None
+    for n in range(1, 4):
+        # bodies are saved once they've been streamed in full
+        assert b''.join(cache.save_as_streamed('http://images/{}.jpg'.format(n), [b'x' * 20, b'x' * 20], {'ETag': str(n)})) == b'x' * 40
+        (path, headers) = cache.get('http://images/{}.jpg'.format(n))
+        assert headers == {'ETag': str(n)}
+        os.utime(path, (n, n))
+
+    # serving the first image again leaves the second least recently served,
+    # so it's the one removed when the cache goes over its size
+    cache.get('http://images/1.jpg')
+    b''.join(cache.save_as_streamed('http://images/4.jpg', [b'x' * 20], {}))
+    assert cache.get('http://images/2.jpg') is None
+    for n in (1, 3, 4):
+        assert cache.get('http://images/{}.jpg'.format(n)) is not None
+
+    # entries older than max_age are fetched again
+    cache = DiskLRU(str(tmp_path), max_size=130, max_file_size=50, max_age=60)
+    assert cache.get('http://images/1.jpg') is not None
+    (path, headers) = cache.get('http://images/1.jpg')
+    with open(path + '.json', 'w') as meta:
+        json.dump({'fetched': time.time() - 61, 'headers': headers}, meta)
+    assert cache.get('http://images/1.jpg') is None
+
+    # an abandoned transfer isn't saved
+    chunks = cache.save_as_streamed('http://images/5.jpg', iter([b'x', b'x']), {})
+    next(chunks)
+    chunks.close()
+    assert cache.get('http://images/5.jpg') is None
+
+
+def test_proxy_cache_ranges(settings, tmp_path, monkeypatch):
+    from django.test import RequestFactory
+    from nuremberg.core import proxy
+    settings.PROXY_CACHE = {'LOCATION': str(tmp_path), 'MAX_SIZE': 1000, 'MAX_FILE_SIZE': 100}
+
+    class Upstream:
+        def __init__(self, status_code, headers):
+            self.status_code = status_code
+            self.headers = headers
+            self.raw = self
+        def stream(self, *args, **kwargs):
+            return iter([b'partial' if self.status_code == 206 else b'x' * 40])
+        def close(self):
+            pass
+
+    def request(method, url, headers, **kwargs):
+        if 'Range' in headers:
+            return Upstream(206, {'Content-Length': '7', 'Content-Range': 'bytes 0-6/40'})
+        return Upstream(200, {'Content-Length': '40'})
+    monkeypatch.setattr(proxy.session, 'request', request)
+
+    view = proxy.proxied(base_url='http://images/', accel_location=None)
+    assert b''.join(view(RequestFactory().get('/'), '1.jpg').streaming_content) == b'x' * 40
+    assert proxy.proxy_cache().get('http://images/1.jpg') is not None
+
+    # a cached image still answers a Range request with the part asked for
+    response = view(RequestFactory().get('/', HTTP_RANGE='bytes=0-6'), '1.jpg')
+    assert (response.status_code, response['Content-Range']) == (206, 'bytes 0-6/40')
+    assert b''.join(response.streaming_content) == b'partial'
+
+
+def test_persistent_cache_culling(tmp_path):
+    from nuremberg.core.cache import InfrequentlyCulledFileCache
+
+    cache = InfrequentlyCulledFileCache(str(tmp_path), {'OPTIONS': {'MAX_ENTRIES': 10, 'CULL_FREQUENCY': 3, 'CULL_EVERY': 5}})
+    # the cache outgrows MAX_ENTRIES between checks
+    for n in range(14):
+        cache.set(n, n)
+    assert len(cache._list_cache_files()) == 14
+    # and the next check culls a third of it
+    cache.set(14, 14)
+    assert len(cache._list_cache_files()) == 11
+
+
+def test_proxy_accel_redirect(settings, monkeypatch):
+    import requests
+    from django.test import RequestFactory
+    from nuremberg.core import proxy
+    settings.PROXY_ACCEL_REDIRECT = True
+    response = client.get('/proxy_image/HLSL_NUR_00001001.jpg')
+    assert response['X-Accel-Redirect'] == '/internal/documents/HLSL_NUR_00001001.jpg'
+    assert 'Content-Type' not in response
+    # printing images are in the documents bucket here, so nginx serves them from its location
+    assert client.get('/proxy_image/printing/HLSL NUR 01.jpg')['X-Accel-Redirect'] == '/internal/documents/HLSL%20NUR%2001.jpg'
+    assert client.get('/proxy_transcript/a/../b.jpg').status_code == 404
+
+    # buckets without an nginx location are proxied by Django
+    def unreachable(*args, **kwargs):
+        raise requests.ConnectionError()
+    monkeypatch.setattr(proxy.session, 'request', unreachable)
+    response = proxy.proxied(base_url='http://example.com/printing/', accel_location=None)(RequestFactory().get('/'), 'HLSL_NUR_01.jpg')
+    assert response.status_code == 502
+    assert 'X-Accel-Redirect' not in response
+
+    # paths leaving the bucket are refused when proxying too
+    settings.PROXY_ACCEL_REDIRECT = False
+    assert client.get('/proxy_transcript/a/../b.jpg').status_code == 404
+    assert client.get('/proxy_image/..').status_code == 404
@@ -1,18 +1,9 @@
 from django.conf import settings
 from django.conf.urls import include, url, re_path
 from django.contrib import admin
-from proxy.views import proxy_view
 from django.views.generic.base import RedirectView
 from django.http import HttpResponse
-from django.views.decorators.csrf import csrf_exempt
-from proxy.views import proxy_view
-
-@csrf_exempt
-def proxied(base_url):
-    def proxy_handler(request, path):
-    	remoteurl = base_url + path
-    	return proxy_view(request, remoteurl)
-    return proxy_handler
+from nuremberg.core.proxy import proxied
 
 urlpatterns = [
     # re_path(r'^admin/', admin.site.urls),
@@ -23,12 +14,14 @@ urlpatterns = [
     re_path(r'^', include('nuremberg.content.urls')),
     re_path(r'^proxy_image/printing/(?P<path>.*)$',
         # RedirectView.as_view(url='http://nuremberg.law.harvard.edu/imagedir/HLSL_NUR_printing/%(url)s')),
-        proxied(base_url=settings.DOCUMENTS_PRINTING_URL)),
+        # nginx.conf proxies only the documents bucket, so printing images kept anywhere else are streamed by Django
+        proxied(base_url=settings.DOCUMENTS_PRINTING_URL,
+            accel_location='/internal/documents/' if settings.DOCUMENTS_PRINTING_URL == settings.DOCUMENTS_URL else None)),
     re_path(r'^proxy_image/(?P<path>.*)$',
         # RedirectView.as_view(url='http://s3.amazonaws.com/nuremberg-documents/%(url)s'))
-        proxied(base_url=settings.DOCUMENTS_URL), name='proxy_image'),
+        proxied(base_url=settings.DOCUMENTS_URL, accel_location='/internal/documents/'), name='proxy_image'),
     re_path(r'^proxy_transcript/(?P<path>.*)$',
-        proxied(base_url=settings.TRANSCRIPTS_URL), name='proxy_transcript'),
+        proxied(base_url=settings.TRANSCRIPTS_URL, accel_location='/internal/transcripts/'), name='proxy_transcript'),
     re_path(r'^robots.txt$', lambda r: HttpResponse("User-agent: *\nDisallow: /search/\n\nUser-agent: SiteimproveBot\nDisallow: /\n\nUser-agent: SiteimproveBot-Crawler\nDisallow: /", content_type="text/plain")),
 ]
 
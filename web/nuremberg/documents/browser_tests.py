@@ -88,23 +88,10 @@ def test_page_navigation(document, viewport):
 
 
 def test_pdf_generation(document):
-    # extremely ugly shim to detect PDF save
-    document.execute_script("""
-        var _cENS = document.createElementNS;
-        document.createElementNS = function () {
-            document.createElementNS = _cENS;
-            window.save_link = document.createElementNS.apply(document, arguments);
-            window.save_link.dispatchEvent = function () {
-                window.save_link_clicked = true;
-            };
-            document.body.appendChild(window.save_link);
-            return window.save_link;
-        }""")
-
     document.find_element_by_css_selector('button.download-pdf').click()
-    inner_save_link = wait(document, 10).until(global_variable_exists('save_link'))
     save_link = wait(document, 1).until(visibility_of_element_located(at('.download-options a')))
-    save_link.click()
-    document.save_screenshot('screenshots/building-pdf.png')
-    download = wait(document, 30).until(element_has_attribute(inner_save_link, 'download'))
-    assert 'HLSL Nuremberg Document #1 pages 1-20.pdf' in download
+    to_page = document.find_element_by_css_selector('.download-options input[name=to-page]')
+    to_page.clear()
+    to_page.send_keys('20')
+    document.execute_script("$('.download-options input').change();")
+    assert save_link.get_attribute('href').endswith(url('documents:pdf', kwargs={'document_id': 1}) + '?from=1&to=20')
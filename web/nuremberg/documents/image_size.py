@@ -0,0 +1,227 @@
+"""
+Reads image dimensions from JPEG, PNG and TIFF headers, fetching only the bytes needed.
+
+Remote images are read in blocks with Range requests, so skipping over a large
+JPEG segment or jumping to a TIFF directory costs a request rather than a download,
+and a shared `requests.Session` keeps every request on the same connection.
+`read_file` reads a whole file from the same kinds of source, and `read_image` a whole JPEG.
+"""
+import requests
+from struct import unpack
+
+BLOCK_SIZE = 4096
+
+# SOF markers carry the frame dimensions; C4, C8 and CC share the range but are not frames
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# markers without a length field
+JPEG_STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8}
+JPEG_SOS = 0xDA
+JPEG_APP14 = 0xEE
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+TIFF_WIDTH = 256
+TIFF_HEIGHT = 257
+
+
+def get_image_size(source, session=None, timeout=30):
+    """
+    Returns (width, height) of the JPEG, PNG or TIFF image at `source`, a local path or http(s) URL,
+    or (None, None) if the image can't be read or its format isn't recognized.
+    """
+    if source.startswith('http://') or source.startswith('https://'):
+        return read_image_size(RangeReader(source, session or requests, timeout))
+    try:
+        with open(source, 'rb') as file:
+            return read_image_size(FileReader(file))
+    except OSError:
+        return (None, None)
+
+
+def read_image(source, session=None, timeout=30):
+    """
+    Returns the contents of the JPEG at `source`, a local path or http(s) URL, or None if it can't be read.
+    """
+    data = read_file(source, session, timeout)
+    if data and data[:2] == b'\xFF\xD8':
+        return data
+
+
+def read_file(source, session=None, timeout=30):
+    """
+    Returns the contents of the file at `source`, a local path or http(s) URL, or None if it can't be read.
+    """
+    if not source:
+        return None
+    if source.startswith('http://') or source.startswith('https://'):
+        try:
+            response = (session or requests).get(source, timeout=timeout)
+        except requests.RequestException:
+            return None
+        data = response.content if response.status_code == 200 else None
+    else:
+        try:
+            with open(source, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+    return data or None
+
+
+def read_image_size(reader):
+    """
+    Returns (width, height) given a reader with a `read(offset, length)` method.
+    """
+    head = reader.read(0, 8)
+    if head[:2] == b'\xFF\xD8':
+        return read_jpeg_size(reader)
+    if head == PNG_SIGNATURE:
+        return read_png_size(reader)
+    if head[:4] in (b'II*\x00', b'MM\x00*'):
+        return read_tiff_size(reader)
+    return (None, None)
+
+
+def read_jpeg_size(reader):
+    return read_jpeg_frame(reader)[:2]
+
+
+def read_jpeg_frame(reader):
+    """
+    Returns (width, height, components) from the first JPEG frame header, or (None, None, None).
+    """
+    for (marker, offset) in read_jpeg_segments(reader):
+        if marker in JPEG_SOF_MARKERS:
+            frame = reader.read(offset + 5, 5)
+            if len(frame) < 5:
+                return (None, None, None)
+            (height, width, components) = unpack('>HHB', frame)
+            return (width, height, components)
+    return (None, None, None)
+
+
+def read_jpeg_adobe(reader):
+    """
+    Returns whether the JPEG has an Adobe APP14 segment before its frame header.
+    Adobe tools mark the CMYK JPEGs they write with it, and store their values inverted.
+    """
+    for (marker, offset) in read_jpeg_segments(reader):
+        if marker == JPEG_APP14 and reader.read(offset + 4, 5) == b'Adobe':
+            return True
+    return False
+
+
+def read_jpeg_segments(reader):
+    """
+    Yields (marker, offset) for each JPEG segment up to the frame header, or the scan if there is none.
+    """
+    offset = 2
+    while True:
+        marker = reader.read(offset, 4)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return
+        if marker[1] == 0xFF: # fill byte
+            offset += 1
+            continue
+        if marker[1] in JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        yield (marker[1], offset)
+        if marker[1] in JPEG_SOF_MARKERS or marker[1] == JPEG_SOS or len(marker) < 4:
+            # image data began, with or without a frame header
+            return
+        # segment length includes its own two bytes
+        offset += 2 + unpack('>H', marker[2:4])[0]
+
+
+def read_png_size(reader):
+    # IHDR is always the first chunk
+    ihdr = reader.read(8, 16)
+    if len(ihdr) < 16 or ihdr[4:8] != b'IHDR':
+        return (None, None)
+    return unpack('>II', ihdr[8:16])
+
+
+def read_tiff_size(reader):
+    # only the first image directory is read
+    endian = '<' if reader.read(0, 2) == b'II' else '>'
+    ifd_offset = reader.read(4, 4)
+    if len(ifd_offset) < 4:
+        return (None, None)
+    (ifd_offset,) = unpack(endian + 'I', ifd_offset)
+    count = reader.read(ifd_offset, 2)
+    if len(count) < 2:
+        return (None, None)
+    (count,) = unpack(endian + 'H', count)
+    entries = reader.read(ifd_offset + 2, count * 12)
+    if len(entries) < count * 12:
+        return (None, None)
+
+    size = {}
+    for n in range(0, len(entries), 12):
+        (tag, field_type) = unpack(endian + 'HH', entries[n:n + 4])
+        if tag in (TIFF_WIDTH, TIFF_HEIGHT):
+            if field_type == 3: # SHORT
+                size[tag] = unpack(endian + 'H', entries[n + 8:n + 10])[0]
+            elif field_type == 4: # LONG
+                size[tag] = unpack(endian + 'I', entries[n + 8:n + 12])[0]
+    return (size.get(TIFF_WIDTH), size.get(TIFF_HEIGHT))
+
+
+class FileReader:
+    def __init__(self, file):
+        self.file = file
+
+    def read(self, offset, length):
+        self.file.seek(offset)
+        return self.file.read(length)
+
+
+class RangeReader:
+    """
+    Reads a remote file in BLOCK_SIZE blocks, fetching each block at most once.
+    """
+    def __init__(self, url, session, timeout=30):
+        self.url = url
+        self.session = session
+        self.timeout = timeout
+        self.blocks = {}
+        self.content = None
+
+    def read(self, offset, length):
+        if self.content is not None:
+            return self.content[offset:offset + length]
+
+        data = b''
+        first = offset // BLOCK_SIZE
+        block = first
+        while len(data) < offset + length - first * BLOCK_SIZE:
+            content = self.fetch(block)
+            if self.content is not None:
+                # the server ignored the Range header and sent the whole file
+                return self.content[offset:offset + length]
+            data += content
+            if len(content) < BLOCK_SIZE:
+                break
+            block += 1
+        start = offset - first * BLOCK_SIZE
+        return data[start:start + length]
+
+    def fetch(self, block):
+        if block not in self.blocks:
+            start = block * BLOCK_SIZE
+            try:
+                response = self.session.get(self.url, headers={'Range': 'bytes={}-{}'.format(start, start + BLOCK_SIZE - 1)},
+                    timeout=self.timeout)
+            except requests.RequestException:
+                # unreachable images read as empty, like missing ones
+                self.blocks[block] = b''
+                return b''
+            if response.status_code == 200:
+                self.content = response.content
+            elif response.status_code == 206:
+                self.blocks[block] = response.content
+            else:
+                # missing images and unsatisfiable ranges read as empty
+                self.blocks[block] = b''
+        return self.blocks.get(block, b'')
@@ -0,0 +1,129 @@
+"""
+Per-document image manifests: every image row of a document as
+[page_number, scale, url, width, height, image_type_id], in page order.
+
+Manifests are written to DOCUMENT_STORAGE by scan_image_files and write_image_manifests,
+so the document page and image API can read image metadata without loading DocumentImage rows.
+Each manifest records how many rows it was built from and the newest row's id, which
+one aggregate query checks on every read, so adding or deleting images any way at all
+rebuilds it. Saving or deleting an image through the ORM rewrites it too, which covers
+images changed in place.
+"""
+import json
+import os
+from functools import lru_cache
+from hashlib import sha1
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files.base import ContentFile
+from django.core.files.storage import get_storage_class
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models import Count, Max
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# manifests built from the database, because no file has been written yet, are only cached for a while
+UNWRITTEN_TIMEOUT = 60 * 60
+
+
+@lru_cache(maxsize=None)
+def document_storage():
+    """
+    The storage holding files derived from document images, configured by settings.DOCUMENT_STORAGE.
+    """
+    return get_storage_class(settings.DOCUMENT_STORAGE['BACKEND'])(**settings.DOCUMENT_STORAGE.get('OPTIONS', {}))
+
+
+@receiver(setting_changed)
+def reset_document_storage(setting, **kwargs):
+    if setting == 'DOCUMENT_STORAGE':
+        document_storage.cache_clear()
+
+
+def manifest_path(document_id):
+    return 'manifests/{:05d}.json'.format(document_id)
+
+
+def cache_key(document_id):
+    return 'document-manifest-{}'.format(document_id)
+
+
+def image_rows(document):
+    """
+    [count, newest id] of the document's image rows, to check a stored manifest against.
+    """
+    rows = document.images.aggregate(count=Count('id'), newest=Max('id'))
+    return [rows['count'], rows['newest']]
+
+
+def build_manifest(document):
+    # in page order, and in a fixed order otherwise, so the version only changes when the rows do
+    rows = list(document.images.order_by('page_number', 'scale', 'id')
+        .values_list('id', 'page_number', 'scale', 'url', 'width', 'height', 'image_type_id'))
+    images = [list(row[1:]) for row in rows]
+    return {
+        'document_id': document.id,
+        # changes whenever any image row does, so it can key anything rendered from the manifest
+        'version': sha1(json.dumps(images).encode('utf8')).hexdigest()[:16],
+        'rows': [len(rows), max((row[0] for row in rows), default=None)],
+        'images': images,
+    }
+
+
+def write_manifest(document):
+    manifest = build_manifest(document)
+    replace_file(document_storage(), manifest_path(document.id),
+        ContentFile(json.dumps(manifest, separators=(',', ':')).encode('utf8')))
+    caches['persistent'].set(cache_key(document.id), manifest, None)
+    return manifest
+
+
+def replace_file(storage, path, content):
+    """
+    Saves `content` at `path`, replacing any file there without a moment when there is none.
+    """
+    try:
+        local_path = storage.path(path)
+    except NotImplementedError:
+        # remote storages replace files in one step, as long as they overwrite
+        # rather than rename (with S3Boto3Storage, file_overwrite=True)
+        storage.save(path, content)
+        return
+    saved = storage.save(path + '.tmp', content)
+    os.replace(storage.path(saved), local_path)
+
+
+def read_manifest(document):
+    """
+    Returns the document's manifest from the cache or its file, rewriting it if its
+    images have changed since, or builds it from the database if it has none.
+    """
+    key = cache_key(document.id)
+    cache = caches['persistent']
+    manifest = cache.get(key)
+    if manifest is None:
+        storage = document_storage()
+        path = manifest_path(document.id)
+        if not storage.exists(path):
+            manifest = build_manifest(document)
+            cache.set(key, manifest, UNWRITTEN_TIMEOUT)
+            return manifest
+        with storage.open(path) as file:
+            manifest = json.load(file)
+        if manifest.get('rows') == image_rows(document):
+            cache.set(key, manifest, None)
+            return manifest
+    elif manifest.get('rows') == image_rows(document):
+        return manifest
+    return write_manifest(document)
+
+
+@receiver(post_save, sender='documents.DocumentImage')
+@receiver(post_delete, sender='documents.DocumentImage')
+def rewrite_manifest(instance, **kwargs):
+    # bulk_create and bulk_update don't send these, so the commands using them write manifests themselves
+    from .models import Document
+    document = Document(id=instance.document_id)
+    transaction.on_commit(lambda: write_manifest(document))
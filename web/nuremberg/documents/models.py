@@ -1,15 +1,46 @@
 from django.conf import settings
-from django.urls import reverse
 from django.utils.text import slugify
 from django.db import models
 import datetime
 import re
 
+from nuremberg.core.proxy import proxy_prefix
+from . import manifests
+
 global_slug_count = 0
 
 IMAGE_URL_ROOT="http://nuremberg.law.harvard.edu/imagedir/HLSL_NMT01"
 
+class DocumentQuerySet(models.QuerySet):
+    def with_display_relations(self, images=False):
+        """
+        Loads everything the document page and search index read from each document:
+        one query for the documents, language and source, plus one per related table,
+        however many documents are loaded. The document page reads images from the
+        image manifest, so they are only prefetched if images=True.
+        """
+        return self.select_related('language', 'source').prefetch_related(*self.display_relations(images))
+
+    @staticmethod
+    def display_relations(images=False):
+        relations = [
+            models.Prefetch('dates', queryset=DocumentDate.objects.order_by('id')),
+            'cases',
+            'personal_authors',
+            'group_authors',
+            'defendants',
+            'activities',
+            models.Prefetch('evidence_codes', queryset=DocumentEvidenceCode.objects.select_related('prefix')),
+            models.Prefetch('exhibit_codes', queryset=DocumentExhibitCode.objects.select_related('defense_name')),
+        ]
+        if images:
+            relations.append('images')
+        return relations
+
+
 class Document(models.Model):
+    objects = DocumentQuerySet.as_manager()
+
     id = models.AutoField(primary_key=True, db_column='DocID')
     title = models.CharField(max_length=255, db_column='TitleDescriptive')
     literal_title = models.TextField(db_column='Title')
@@ -24,15 +55,54 @@ class Document(models.Model):
         return range(1, (self.image_count or 0) + 1)
 
     def images_screen(self):
-        test_empty = self.images.all()
-        test_empty = len(test_empty)
-        if test_empty:
-            return (image for image in self.images.all() if image.scale == DocumentImage.SCREEN)
+        images = self.page_images()
+        if images:
+            return [image for image in images if image.scale == DocumentImage.SCREEN]
         else:
             return "no images"
 
+    def cache_version(self):
+        """
+        Identifies the current state of this document and its images, for keying cached fragments of its page.
+        """
+        return '{}-{}'.format(self.updated_at.timestamp() if self.updated_at else 0, self.image_manifest()['version'])
+
+    def image_manifest(self):
+        """
+        This document's image manifest (see nuremberg.documents.manifests), read once per instance.
+        """
+        if not hasattr(self, '_image_manifest'):
+            self._image_manifest = manifests.read_manifest(self)
+        return self._image_manifest
+
+    def page_images(self):
+        """
+        Unsaved DocumentImages built from the image manifest, in page order, so that
+        rendering a document's pages doesn't query its image rows.
+        """
+        if not hasattr(self, '_page_images'):
+            self._page_images = [DocumentImage(document=self, page_number=page_number, scale=scale, url=url,
+                width=width, height=height, image_type_id=image_type_id)
+                for (page_number, scale, url, width, height, image_type_id) in self.image_manifest()['images']]
+        return self._page_images
+
+    def image_index(self):
+        """
+        Maps (page_number, scale) to each image, built once from the manifest
+        so that per-image scale lookups don't rescan them.
+        """
+        if not hasattr(self, '_image_index'):
+            self._image_index = {}
+            for image in self.page_images():
+                self._image_index.setdefault((image.page_number, image.scale), image)
+        return self._image_index
+
     def date(self):
-        date = self.dates.first()
+        # the first date by id, as dates.first() orders them, read from prefetched dates when there are any
+        if 'dates' in getattr(self, '_prefetched_objects_cache', {}):
+            date = min(self.dates.all(), key=lambda date: date.id, default=None)
+        else:
+            date = self.dates.order_by('id').first()
         if date:
             return date.as_date()
 
@@ -86,21 +156,24 @@ class DocumentImage(models.Model):
 
     image_type = models.ForeignKey('DocumentImageType', on_delete=models.PROTECT)
 
-    def __getattribute__(self, attrname):
-        orig = super().__getattribute__(attrname)
-        if attrname == 'url' and settings.PROXY_DOCUMENT_IMAGE_THUMBS and orig and orig.startswith('/static/image_cache/thumb/'):
-            return reverse('proxy_image', kwargs={'path': orig.split('/')[-1]})
-        return orig
+    @property
+    def display_url(self):
+        """
+        The URL pages show this image at: `url`, except that cached thumbnails are
+        served through the image proxy if PROXY_DOCUMENT_IMAGE_THUMBS is set.
+        """
+        url = self.url
+        if url and settings.PROXY_DOCUMENT_IMAGE_THUMBS and url.startswith('/static/image_cache/thumb/'):
+            return proxy_prefix('proxy_image') + url.rsplit('/', 1)[-1]
+        return url
 
     def find_url(self, scale):
         if self.scale == scale:
-            return url
+            return self.display_url
         else:
-            images = self.document.images.all()
-            filter = (image for image in images if image.page_number == self.page_number and image.scale == scale)
-            scaled = next(filter, None)
+            scaled = self.document.image_index().get((self.page_number, scale))
             if scaled:
-                return scaled.url
+                return scaled.display_url
             else:
                 return None
 
@@ -111,8 +184,26 @@ class DocumentImage(models.Model):
     def full_url(self):
         return self.find_url(self.FULL)
 
+    def source_url(self):
+        """
+        The URL the server can fetch this image from, resolving the proxied and
+        protocol-relative forms that image URLs are stored in.
+        """
+        url = self.url
+        if not url:
+            return None
+        if url.startswith('/proxy_image/printing/'):
+            return settings.DOCUMENTS_PRINTING_URL + url[len('/proxy_image/printing/'):]
+        if url.startswith('/proxy_image/'):
+            return settings.DOCUMENTS_URL + url[len('/proxy_image/'):]
+        if url.startswith('/static/image_cache/thumb/'):
+            return settings.DOCUMENTS_URL + url.split('/')[-1]
+        if url.startswith('//'):
+            return 'http:' + url
+        return url
+
     def image_tag(self):
-        return '<a href="{0}"><img src="{0}" alt="Scanned document page {1}" width=100 /></a>'.format(self.url, self.page_number)
+        return '<a href="{0}"><img src="{0}" alt="Scanned document page {1}" width=100 /></a>'.format(self.display_url, self.page_number)
     image_tag.allow_tags = True
 
     def __str__(self):
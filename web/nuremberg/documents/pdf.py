@@ -0,0 +1,161 @@
+"""
+Streams a PDF of document page images, one page at a time.
+
+Page images are JPEGs, which PDF can embed as-is with the DCTDecode filter, so each
+page is written as soon as its image is fetched and nothing is decoded or held
+beyond a few pages of lookahead. Object offsets are tracked as bytes are yielded,
+and the cross-reference table is written at the end.
+"""
+import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+from .image_size import read_image, read_jpeg_adobe, read_jpeg_frame
+
+# page images are sized for 75 pixels per inch, as the document viewer displays them
+PIXELS_PER_INCH = 75
+POINTS_PER_INCH = 72
+# US letter, for the cover page and pages without an image
+LETTER = (612, 792)
+
+COLOR_SPACES = {1: '/DeviceGray', 3: '/DeviceRGB', 4: '/DeviceCMYK'}
+
+# the catalog, page tree and font come first; each page then takes three objects
+CATALOG, PAGES, FONT = 1, 2, 3
+FIRST_PAGE_OBJECT = 4
+
+
+def stream_pdf(sources, cover=None, workers=4, timeout=30):
+    """
+    Yields the bytes of a PDF with a page for each JPEG in `sources` (local paths or
+    http(s) URLs, None for a missing page), preceded by a page of `cover` text lines if given.
+
+    Images are fetched `workers` at a time, ahead of the page being written.
+    """
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_maxsize=workers))
+    session.mount('https://', HTTPAdapter(pool_maxsize=workers))
+    pool = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    sources = iter(sources)
+
+    def fetch_next():
+        for source in sources:
+            pending.append((source, pool.submit(read_image, source, session, timeout)))
+            return
+
+    try:
+        for _ in range(workers * 2):
+            fetch_next()
+
+        writer = PDFWriter()
+        yield writer.header()
+        if cover:
+            yield writer.text_page(cover)
+        while pending:
+            (source, future) = pending.popleft()
+            fetch_next()
+            data = future.result()
+            if data:
+                reader = BytesReader(data)
+                (width, height, components) = read_jpeg_frame(reader)
+                if width and components in COLOR_SPACES:
+                    inverted = components == 4 and read_jpeg_adobe(reader)
+                    yield writer.image_page(data, width, height, components, inverted)
+                    continue
+            yield writer.text_page(['Page image unavailable.', source or ''])
+        yield writer.trailer()
+    finally:
+        # also reached when the client disconnects and the response closes this generator
+        for (source, future) in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+        session.close()
+
+
+class BytesReader:
+    # reads image bytes already in memory, like the readers in image_size
+    def __init__(self, data):
+        self.data = data
+
+    def read(self, offset, length):
+        return self.data[offset:offset + length]
+
+
+class PDFWriter:
+    """
+    Serializes PDF objects, tracking the offset of each so the cross-reference table can be written last.
+
+    Pages are numbered as they're written, and the page tree, which lists them all,
+    is written after the last page.
+    """
+    def __init__(self):
+        self.offset = 0
+        self.offsets = {}
+        self.pages = []
+
+    def header(self):
+        # the binary comment marks the file as binary to transfer programs
+        return self.emit(b'%PDF-1.4\n%\xE2\xE3\xCF\xD3\n')
+
+    def emit(self, data):
+        self.offset += len(data)
+        return data
+
+    def object(self, number, body, stream=None):
+        self.offsets[number] = self.offset
+        data = '{} 0 obj\n'.format(number).encode('ascii') + body
+        if stream is not None:
+            data += b'\nstream\n' + stream + b'\nendstream'
+        return self.emit(data + b'\nendobj\n')
+
+    def page(self, size, contents, image=None):
+        """
+        Writes a page with its content stream, and its image as (dictionary, JPEG data) if it has one.
+        """
+        number = FIRST_PAGE_OBJECT + 3 * len(self.pages)
+        self.pages.append(number)
+        resources = '/Font << /F1 {} 0 R >>'.format(FONT)
+        if image:
+            resources += ' /XObject << /Im {} 0 R >>'.format(number + 2)
+        data = self.object(number, '<< /Type /Page /Parent {} 0 R /MediaBox [0 0 {:.2f} {:.2f}] /Resources << {} >> /Contents {} 0 R >>'.format(
+            PAGES, size[0], size[1], resources, number + 1).encode('ascii'))
+        data += self.object(number + 1, '<< /Length {} >>'.format(len(contents)).encode('ascii'), contents)
+        # pages without an image still take its object number, so numbering stays predictable
+        data += self.object(number + 2, *(image or (b'null',)))
+        return data
+
+    def image_page(self, jpeg, width, height, components, inverted=False):
+        size = (width * POINTS_PER_INCH / PIXELS_PER_INCH, height * POINTS_PER_INCH / PIXELS_PER_INCH)
+        contents = 'q {:.2f} 0 0 {:.2f} 0 0 cm /Im Do Q'.format(*size).encode('ascii')
+        # CMYK JPEGs from Adobe tools store inverted values; other CMYK JPEGs are decoded as they are
+        decode = ' /Decode [1 0 1 0 1 0 1 0]' if inverted else ''
+        image = '<< /Type /XObject /Subtype /Image /Width {} /Height {} /ColorSpace {} /BitsPerComponent 8{} /Filter /DCTDecode /Length {} >>'.format(
+            width, height, COLOR_SPACES[components], decode, len(jpeg)).encode('ascii')
+        return self.page(size, contents, (image, jpeg))
+
+    def text_page(self, lines):
+        commands = ['BT /F1 12 Tf 14 TL 54 738 Td']
+        for line in lines:
+            commands.append('({}) Tj T*'.format(escape_text(line)))
+        commands.append('ET')
+        contents = '\n'.join(commands).encode('cp1252', 'replace')
+        return self.page(LETTER, contents)
+
+    def trailer(self):
+        data = self.object(CATALOG, '<< /Type /Catalog /Pages {} 0 R >>'.format(PAGES).encode('ascii'))
+        data += self.object(PAGES, '<< /Type /Pages /Kids [{}] /Count {} >>'.format(
+            ' '.join('{} 0 R'.format(page) for page in self.pages), len(self.pages)).encode('ascii'))
+        data += self.object(FONT, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+
+        size = max(self.offsets) + 1
+        xref = ['xref', '0 {}'.format(size), '0000000000 65535 f ']
+        for number in range(1, size):
+            xref.append('{:010d} 00000 n '.format(self.offsets[number]))
+        xref.append('trailer\n<< /Size {} /Root {} 0 R >>\nstartxref\n{}\n%%EOF\n'.format(size, CATALOG, self.offset))
+        return data + '\n'.join(xref).encode('ascii')
+
+
+def escape_text(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
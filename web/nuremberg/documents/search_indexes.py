@@ -36,14 +36,7 @@ class DocumentIndex(indexes.SearchIndex, indexes.Indexable):
         return 'updated_at'
 
     def index_queryset(self, using=None):
-        return Document.objects \
-            .select_related() \
-            .prefetch_related('dates') \
-            .prefetch_related('cases') \
-            .prefetch_related('personal_authors') \
-            .prefetch_related('group_authors') \
-            .prefetch_related('defendants') \
-            .all()
+        return Document.objects.with_display_relations()
 
     def prepare_grouping_key(self, document):
         # This is a hack to group transcripts but not documents in a single query.
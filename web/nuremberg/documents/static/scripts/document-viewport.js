@@ -21,10 +21,11 @@ modulejs.define('DocumentViewport', ['Images', 'DraggingMixin', 'DownloadQueue']
   var View = Backbone.View.extend({
     options: {
       preloadRange: 200,
+      pageWindow: 50,
     },
     initialize: function () {
       var view = this;
-      _.bindAll(this, 'zoomIn', 'zoomOut', 'goToPage', 'render', 'setTool', 'smoothZoom', 'wheelZoom', 'magnifyTool', 'toggleExpand', 'recalculateVisible');
+      _.bindAll(this, 'zoomIn', 'zoomOut', 'goToPage', 'render', 'setTool', 'smoothZoom', 'wheelZoom', 'magnifyTool', 'toggleExpand', 'recalculateVisible', 'loadPages');
 
       // throttle heavy calls
       this.recalculateVisible = _.debounce(this.recalculateVisible, 50);
@@ -44,6 +45,10 @@ modulejs.define('DocumentViewport', ['Images', 'DraggingMixin', 'DownloadQueue']
       // set up convenience elements
       this.$viewport = this.$el;
       this.$layout = this.$el.find('.document-image-layout');
+
+      // large documents only render their first pages, the rest are fetched as they are needed
+      this.model.attributes.pageCount = parseInt(this.$layout.data('page-count')) || this.imageViews.length;
+      this.imagesURL = this.$layout.data('images-url');
       this.pagePlaceholder = $('<div></div>').css({
         display: 'inline-block',
         width: 0,
@@ -506,8 +511,81 @@ modulejs.define('DocumentViewport', ['Images', 'DraggingMixin', 'DownloadQueue']
       }
     },
 
+    loadPages: function (toPage) {
+      // Fetch the next window of pages (or every page up to toPage) from the image API,
+      // and append them to the layout. Returns a promise resolved once they are added.
+      var view = this;
+      var loaded = this.imageViews.length;
+      if (loaded >= this.model.attributes.pageCount || (toPage && toPage <= loaded)) {
+        return $.Deferred().resolve().promise();
+      }
+
+      // only one request at a time
+      if (!this.pagesLoading) {
+        var lastPage = loaded ? parseInt(this.imageViews[loaded - 1].$el.data('page-number')) : 0;
+        this.pagesLoading = $.getJSON(this.imagesURL, {
+          from: lastPage + 1,
+          to: lastPage + Math.max(this.options.pageWindow, (toPage || 0) - loaded),
+        }).then(function (response) {
+          view.pagesLoading = null;
+          if (!response.images.length) {
+            // nothing left to load
+            view.model.attributes.pageCount = view.imageViews.length;
+          }
+          view.addImages(response.images);
+        }, function () {
+          view.pagesLoading = null;
+        });
+      }
+
+      return this.pagesLoading.then(function () {
+        if (toPage)
+          return view.loadPages(toPage);
+      });
+    },
+
+    addImages: function (images) {
+      // build page elements for images from the image API, matching those rendered in the template
+      var first = this.imageViews.length;
+      var $imgs = $(_.map(images, function (image, n) {
+        var page = first + n + 1;
+        var $el = $('<div class="document-image"></div>').attr({
+          'data-screen-url': image.url || '',
+          'data-thumb-url': image.urls.thumb || '',
+          'data-full-url': image.urls.full || '',
+          'data-width': image.width,
+          'data-height': image.height,
+          'data-page': page,
+          'data-page-number': image.page,
+          'data-alt': 'Document page ' + page,
+        }).css({
+          width: image.width + 'px',
+          height: image.height + 'px',
+        }).addClass(image.url ? 'loaded' : 'image-missing loading');
+        $('<div class="image-label"></div>')
+          .text(image.url ? image.page : 'Missing Image No. ' + image.page)
+          .appendTo($el);
+        return $el[0];
+      }));
+      $imgs.appendTo(this.$layout);
+
+      var images = this.model.attributes.images;
+      var start = images.length;
+      images.scan($imgs);
+      this.imageViews = this.imageViews.concat(_.map(_.zip(images.models.slice(start), $imgs.toArray()), function (image) {
+        return new ImageView({ model: image[0], el: image[1] });
+      }));
+      this.model.attributes.totalPages = this.imageViews.length;
+      this.recalculateVisible();
+    },
+
     goToPage: function (page) {
       // bring the provided page number into view, used by page selection tools
+      page = parseInt(page);
+      if (page > this.imageViews.length && page <= this.model.attributes.pageCount) {
+        this.loadPages(page).then(_.bind(this.goToPage, this, page));
+        return;
+      }
       var image = this.model.attributes.images.find(function (i) { return i.attributes.page == page; });
       if (image) {
         this.model.attributes.firstVisible = null;
@@ -522,6 +600,13 @@ modulejs.define('DocumentViewport', ['Images', 'DraggingMixin', 'DownloadQueue']
       var view = this;
       var size = size || 'screen';
       var promise = $.Deferred()
+      if (toPage > this.imageViews.length) {
+        // fetch the missing pages first
+        this.loadPages(toPage).then(function () {
+          view.preloadRange(fromPage, toPage).progress(promise.notify).then(promise.resolve);
+        });
+        return promise;
+      }
       fromPage -= 1;
       toPage -= 1;
       var total = toPage - fromPage + 1;
@@ -660,6 +745,11 @@ modulejs.define('DocumentViewport', ['Images', 'DraggingMixin', 'DownloadQueue']
         }
         this.model.trigger('firstVisible', this.imageViews[firstVisible].model);
       }
+
+      if (lastVisible !== null && lastVisible >= this.imageViews.length - 1) {
+        // the last loaded page is in preload range, fetch more
+        this.loadPages();
+      }
     },
   });
 
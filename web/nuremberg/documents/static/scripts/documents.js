@@ -1,4 +1,4 @@
-modulejs.define('documents', ['DocumentViewport', 'DocumentTools', 'DownloadPDF'], function (DocumentViewport, DocumentTools, DownloadPDF) {
+modulejs.define('documents', ['DocumentViewport', 'DocumentTools'], function (DocumentViewport, DocumentTools) {
   var viewportView = new DocumentViewport;
   var toolbarView = new DocumentTools({el: $('.document-tools')});
   var overlayView = new DocumentTools({el: $('.document-tools-overlay')});
@@ -32,14 +32,17 @@ modulejs.define('documents', ['DocumentViewport', 'DocumentTools', 'DownloadPDF'
     viewportView.goToPage(match[1]);
   }
 
+  var pdfHref = function (fromPage, toPage) {
+    return $('.download-options').data('pdf-url') + '?from=' + fromPage + '&to=' + toPage;
+  };
   $('.download-pdf').on('click', function () {
     $('.download-pdf').addClass('hide');
     $('.download-options').removeClass('hide');
     $('.download-options input[name=from-page]').val(1);
-    $('.download-options input[name=to-page]').val(viewportView.model.attributes.totalPages);
-    modulejs.require('JSPDFLoaded');
+    $('.download-options input[name=to-page]').val(viewportView.model.attributes.pageCount);
+    $('.do-download').attr('href', pdfHref(1, viewportView.model.attributes.pageCount));
   });
-  $('.do-download').on('click', function () {
+  $('.download-options input').on('change', function () {
     var fromPage = parseInt($('.download-options input[name=from-page]').val());
     var toPage = parseInt($('.download-options input[name=to-page]').val());
     if (toPage < fromPage) {
@@ -47,13 +50,18 @@ modulejs.define('documents', ['DocumentViewport', 'DocumentTools', 'DownloadPDF'
       toPage = fromPage;
       fromPage = t;
     }
-    if (fromPage > viewportView.model.attributes.totalPages || toPage > viewportView.model.attributes.totalPages || fromPage < 1 || toPage < 1) {
-      $('.download-options input[name=from-page]').val(1);
-      $('.download-options input[name=to-page]').val(viewportView.model.attributes.totalPages);
-      return;
+    if (!(fromPage >= 1 && toPage <= viewportView.model.attributes.pageCount)) {
+      fromPage = 1;
+      toPage = viewportView.model.attributes.pageCount;
+      $('.download-options input[name=from-page]').val(fromPage);
+      $('.download-options input[name=to-page]').val(toPage);
     }
-
-    DownloadPDF(viewportView, fromPage, toPage);
+    $('.do-download').attr('href', pdfHref(fromPage, toPage));
+  });
+  $('.do-download').on('click', function () {
+    // the server streams the PDF as it assembles it, so the browser shows the download's progress
+    $('.download-options').addClass('hide');
+    $('.download-pdf').removeClass('hide');
   });
 
   $('.clear-search').on('click', function (e) {
@@ -71,9 +71,11 @@ def test_document_3799():
 
     assert 'Journal and office records of Hans Frank, Governor General of Poland, 1939-1944' in page('h1').text()
 
+    # only the first pages are rendered, the viewer fetches the rest from the image API
+    assert page('.document-image-layout').attr['data-page-count'] == '492'
     images = page('.document-image img')
-    assert len(images) == 492
-    assert 'HLSL_NUR_03799492.jpg' in PyQuery(images[491]).attr['src']
+    assert len(images) == 50
+    assert 'HLSL_NUR_03799050.jpg' in PyQuery(images[49]).attr['src']
 
     info = page('.document-info').text()
     assert 'NMT 1' not in info
@@ -83,3 +85,319 @@ def test_document_3799():
     assert 'Language of Text: German' in info
     assert 'Source of Text: Photostat' in info
     assert 'HLSL Item No.: 3799' in info
+
+
+def test_document_images_api():
+    response = client.get(url('documents:images', kwargs={'document_id': 3799}), {'from': 451, 'to': 500})
+    data = response.json()
+    assert data['total_pages'] == 492
+    assert [image['page'] for image in data['images']] == list(range(451, 493))
+    assert 'HLSL_NUR_03799492.jpg' in data['images'][-1]['url']
+    assert data['images'][-1]['urls']['screen'] == data['images'][-1]['url']
+
+    response = client.get(url('documents:images', kwargs={'document_id': 3799}))
+    assert [image['page'] for image in response.json()['images']] == list(range(1, 51))
+
+    # malformed page numbers fall back to the defaults
+    response = client.get(url('documents:images', kwargs={'document_id': 3799}), {'from': 'x', 'to': '1e3'})
+    assert [image['page'] for image in response.json()['images']] == list(range(1, 51))
+
+
+def test_get_image_size(tmp_path):
+    from struct import pack
+    from nuremberg.documents.image_size import get_image_size
+
+    # progressive JPEG with a large EXIF segment before the frame header
+    exif = b'\xFF\xE1' + pack('>H', 60002) + b'\x00' * 60000
+    sof2 = b'\xFF\xC2' + pack('>HBHHB', 11, 8, 1200, 800, 1) + b'\x01\x11\x00'
+    (tmp_path / 'page.jpg').write_bytes(b'\xFF\xD8' + exif + sof2 + b'\xFF\xDA')
+    assert get_image_size(str(tmp_path / 'page.jpg')) == (800, 1200)
+
+    (tmp_path / 'page.png').write_bytes(b'\x89PNG\r\n\x1a\n' + pack('>I', 13) + b'IHDR' + pack('>II', 640, 480) + b'\x08\x02\x00\x00\x00')
+    assert get_image_size(str(tmp_path / 'page.png')) == (640, 480)
+
+    for endian, magic in (('<', b'II*\x00'), ('>', b'MM\x00*')):
+        ifd = pack(endian + 'H', 2) + pack(endian + 'HHIHH', 256, 3, 1, 300, 0) + pack(endian + 'HHII', 257, 4, 1, 400)
+        (tmp_path / 'page.tif').write_bytes(magic + pack(endian + 'I', 8) + ifd)
+        assert get_image_size(str(tmp_path / 'page.tif')) == (300, 400)
+        # truncated headers and directories read like unrecognized images
+        for length in (6, 9, len(ifd)):
+            (tmp_path / 'page.tif').write_bytes((magic + pack(endian + 'I', 8) + ifd)[:length])
+            assert get_image_size(str(tmp_path / 'page.tif')) == (None, None)
+
+    (tmp_path / 'page.txt').write_bytes(b'not an image')
+    assert get_image_size(str(tmp_path / 'page.txt')) == (None, None)
+    assert get_image_size(str(tmp_path / 'missing.jpg')) == (None, None)
+
+
+class RangeSession:
+    """
+    Serves `content` to RangeReader like a server that supports Range requests.
+    """
+    def __init__(self, content, error=None):
+        self.content = content
+        self.error = error
+        self.ranges = []
+
+    def get(self, url, headers={}, timeout=None):
+        from types import SimpleNamespace
+        assert timeout
+        if self.error:
+            raise self.error
+        (start, end) = (int(n) for n in headers['Range'][len('bytes='):].split('-'))
+        self.ranges.append((start, end))
+        return SimpleNamespace(status_code=206, content=self.content[start:end + 1])
+
+
+def test_get_remote_image_size():
+    from struct import pack
+    from nuremberg.documents.image_size import get_image_size, RangeReader
+
+    # the frame header starts 2 bytes before the end of the first block, so reading it crosses into the second
+    exif = b'\xFF\xE1' + pack('>H', 4090) + b'\x00' * 4088
+    sof0 = b'\xFF\xC0' + pack('>HBHHB', 11, 8, 1200, 800, 1) + b'\x01\x11\x00'
+    session = RangeSession(b'\xFF\xD8' + exif + sof0 + b'\xFF\xDA' + b'\x00' * 5000)
+    assert get_image_size('https://example.com/page.jpg', session=session) == (800, 1200)
+    assert session.ranges == [(0, 4095), (4096, 8191)]
+
+    reader = RangeReader('https://example.com/page.jpg', session)
+    assert reader.read(4094, 4) == session.content[4094:4098]
+    assert reader.read(4000, 4200) == session.content[4000:8200]
+    assert reader.read(9000, 100) == session.content[9000:9100]
+    assert reader.read(20000, 10) == b''
+
+    # unreachable images read like unrecognized ones
+    import requests
+    session = RangeSession(session.content, error=requests.ConnectionError())
+    assert get_image_size('https://example.com/page.jpg', session=session) == (None, None)
+
+
+def test_document_image_urls(django_assert_num_queries):
+    from nuremberg.documents.models import Document, DocumentImage
+
+    document = Document.objects.prefetch_related('images').get(id=2)
+    images = list(document.images.all())
+    with django_assert_num_queries(0):
+        for image in document.images_screen():
+            for scale in (DocumentImage.THUMB, DocumentImage.SCREEN, DocumentImage.FULL):
+                scaled = next((other for other in images if other.page_number == image.page_number and other.scale == scale), None)
+                assert image.find_url(scale) == (scaled.display_url if scaled else None)
+
+
+def test_document_date(django_assert_num_queries):
+    import datetime
+    from nuremberg.documents.models import Document, DocumentDate
+
+    document = Document.objects.get(id=1)
+    document.dates.all().delete()
+    DocumentDate.objects.create(document=document, day=2, month=1, year=1947)
+    DocumentDate.objects.create(document=document, day=1, month=1, year=1946)
+
+    # the first date entered, whether or not dates were prefetched
+    assert Document.objects.get(id=1).date() == datetime.date(1947, 1, 2)
+    document = Document.objects.with_display_relations().get(id=1)
+    with django_assert_num_queries(0):
+        assert document.date() == datetime.date(1947, 1, 2)
+        assert [date.year for date in document.dates.all()] == [1947, 1946]
+
+
+def use_document_storage(settings, tmp_path):
+    settings.DOCUMENT_STORAGE = {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        'OPTIONS': {'location': str(tmp_path)},
+    }
+
+
+def test_document_fragment_cache(settings, tmp_path, django_assert_num_queries):
+    use_document_storage(settings, tmp_path)
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+        'persistent': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-documents'},
+    }
+    first = client.get(url('documents:show', kwargs={'document_id': 400})).content
+    # the document, and checking its image manifest is current
+    with django_assert_num_queries(2):
+        cached = client.get(url('documents:show', kwargs={'document_id': 400})).content
+    assert cached == first
+
+
+def test_document_query_count(settings, tmp_path, django_assert_num_queries):
+    use_document_storage(settings, tmp_path)
+    # the document with its language and source, its images (with no manifest written),
+    # and one query per relation (dates, cases, personal and group authors, defendants, activities, evidence and exhibit codes)
+    for document_id in (1, 400, 3799):
+        with django_assert_num_queries(10):
+            document(document_id)
+
+
+def test_document_image_manifest(settings, tmp_path, django_assert_num_queries):
+    from nuremberg.documents.manifests import write_manifest
+    from nuremberg.documents.models import Document
+
+    use_document_storage(settings, tmp_path)
+    expected = document(3799)
+    write_manifest(Document.objects.get(id=3799))
+    assert (tmp_path / 'manifests' / '03799.json').exists()
+
+    # images are read from the manifest file rather than the database, which only checks it's current
+    with django_assert_num_queries(10):
+        page = document(3799)
+    assert page('.document-image-layout').outer_html() == expected('.document-image-layout').outer_html()
+
+
+def test_document_image_manifest_changes(settings, tmp_path):
+    import json
+    from django.test import TestCase
+    from nuremberg.documents.manifests import read_manifest, write_manifest
+    from nuremberg.documents.models import Document, DocumentImage
+
+    use_document_storage(settings, tmp_path)
+    settings.CACHES = dict(settings.CACHES, persistent={'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-manifests'})
+    document = Document.objects.get(id=1)
+    manifest = write_manifest(document)
+    path = tmp_path / 'manifests' / '00001.json'
+
+    # an image added without the ORM's signals is noticed when the manifest is read, and the file rewritten
+    image = DocumentImage.objects.filter(document=document).first()
+    DocumentImage.objects.bulk_create([DocumentImage(document=document, page_number=999, scale=DocumentImage.SCREEN,
+        url=image.url, image_type_id=image.image_type_id)])
+    updated = read_manifest(Document.objects.get(id=1))
+    assert updated['version'] != manifest['version']
+    assert [999, DocumentImage.SCREEN] in [row[:2] for row in updated['images']]
+    assert json.loads(path.read_text()) == updated
+    assert [file.name for file in path.parent.iterdir()] == [path.name]
+
+    # an image changed in place rewrites it once the change is committed
+    image.width = 12345
+    with TestCase.captureOnCommitCallbacks(execute=True):
+        image.save()
+    assert read_manifest(Document.objects.get(id=1))['version'] != updated['version']
+    assert 12345 in [row[3] for row in json.loads(path.read_text())['images']]
+
+
+def test_build_manifest():
+    from nuremberg.documents.manifests import build_manifest
+    from nuremberg.documents.models import Document
+
+    manifest = build_manifest(Document.objects.get(id=1))
+    pages = [(page_number, scale) for (page_number, scale, url, width, height, image_type_id) in manifest['images']]
+    assert pages == sorted(pages)
+    assert build_manifest(Document.objects.get(id=1)) == manifest
+
+
+def test_document_pdf(settings, tmp_path, monkeypatch):
+    import re
+    from struct import pack
+    from nuremberg.documents.manifests import document_storage
+    from nuremberg.documents.models import Document, DocumentImage
+    from nuremberg.documents.pdf import stream_pdf
+    from nuremberg.documents.views import Pdf
+
+    # a baseline RGB frame header is all the writer reads from a page image
+    jpeg = b'\xFF\xD8' + b'\xFF\xC0' + pack('>HBHHB', 17, 8, 1100, 850, 3) + b'\x00' * 9 + b'\xFF\xDA\xFF\xD9'
+    (tmp_path / 'page.jpg').write_bytes(jpeg)
+    pdf = b''.join(stream_pdf([str(tmp_path / 'page.jpg'), None], cover=['Cover (page)']))
+    assert pdf.startswith(b'%PDF-1.4')
+    assert jpeg in pdf
+    assert b'/MediaBox [0 0 816.00 1056.00]' in pdf
+    assert b'(Cover \\(page\\)) Tj' in pdf
+    assert b'/Count 3' in pdf
+
+    # every cross-reference entry points at its object
+    startxref = int(re.search(rb'startxref\n(\d+)', pdf).group(1))
+    assert pdf[startxref:].startswith(b'xref')
+    offsets = re.findall(rb'(\d{10}) 00000 n ', pdf[startxref:])
+    for number, offset in enumerate(offsets, start=1):
+        assert pdf[int(offset):].startswith(b'%d 0 obj' % number)
+
+    # only CMYK JPEGs with an Adobe APP14 segment are inverted
+    cmyk = b'\xFF\xC0' + pack('>HBHHB', 20, 8, 1100, 850, 4) + b'\x00' * 12 + b'\xFF\xDA\xFF\xD9'
+    adobe = b'\xFF\xEE' + pack('>H', 14) + b'Adobe' + b'\x00' * 7
+    (tmp_path / 'cmyk.jpg').write_bytes(b'\xFF\xD8' + cmyk)
+    (tmp_path / 'adobe.jpg').write_bytes(b'\xFF\xD8' + adobe + cmyk)
+    assert b'/Decode' not in b''.join(stream_pdf([str(tmp_path / 'cmyk.jpg')]))
+    assert b'/ColorSpace /DeviceCMYK /BitsPerComponent 8 /Decode [1 0 1 0 1 0 1 0]' in b''.join(stream_pdf([str(tmp_path / 'adobe.jpg')]))
+
+    # PDFs of the whole document already saved for its current version are served from storage
+    use_document_storage(settings, tmp_path)
+    path = Pdf.pdf_path(Document.objects.get(id=1))
+    (tmp_path / path).parent.mkdir(parents=True)
+    (tmp_path / path).write_bytes(pdf)
+    response = client.get(url('documents:pdf', kwargs={'document_id': 1}), {'from': 1, 'to': 20})
+    assert response['Content-Disposition'] == 'attachment; filename="HLSL Nuremberg Document #1 pages 1-20.pdf"'
+    assert b''.join(response.streaming_content) == pdf
+
+    # malformed page numbers fall back to the whole document
+    response = client.get(url('documents:pdf', kwargs={'document_id': 1}), {'from': 'first', 'to': 20})
+    assert response['Content-Disposition'] == 'attachment; filename="HLSL Nuremberg Document #1 pages 1-20.pdf"'
+
+    # other ranges aren't saved
+    DocumentImage.objects.filter(document_id=1).update(url=None)
+    response = client.get(url('documents:pdf', kwargs={'document_id': 1}), {'from': 2, 'to': 3})
+    assert b''.join(response.streaming_content).startswith(b'%PDF-1.4')
+    assert [file.name for file in (tmp_path / path).parent.iterdir()] == [(tmp_path / path).name]
+
+    # a download that finds the PDF missing, but that another download saves first, leaves only one copy
+    storage = document_storage()
+    found = storage.exists
+    checked = []
+    def exists(name):
+        if name == path and not checked:
+            checked.append(name)
+            return False
+        return found(name)
+    monkeypatch.setattr(storage, 'exists', exists)
+    assert b''.join(Pdf.save_as_streamed(path, iter([b'%PDF']))) == b'%PDF'
+    assert [file.name for file in (tmp_path / path).parent.iterdir()] == [(tmp_path / path).name]
+    assert (tmp_path / path).read_bytes() == pdf
+
+
+def test_document_image_display_url(settings):
+    from nuremberg.documents.models import DocumentImage
+
+    settings.PROXY_DOCUMENT_IMAGE_THUMBS = True
+    image = DocumentImage(url='/static/image_cache/thumb/HLSL_NUR_00001001.jpg')
+    assert image.display_url == '/proxy_image/HLSL_NUR_00001001.jpg'
+    # the stored url is left as it is, so saving the image doesn't store the proxied one
+    assert image.url == '/static/image_cache/thumb/HLSL_NUR_00001001.jpg'
+    assert DocumentImage(url='/proxy_image/HLSL_NUR_00001001.jpg').display_url == '/proxy_image/HLSL_NUR_00001001.jpg'
+
+    settings.PROXY_DOCUMENT_IMAGE_THUMBS = False
+    assert image.display_url == '/static/image_cache/thumb/HLSL_NUR_00001001.jpg'
+
+
+def test_image_derivatives(settings, tmp_path):
+    from PIL import Image
+    from nuremberg.core.management.commands.generate_image_derivatives import make_derivatives
+    from nuremberg.documents.models import DocumentImage
+
+    settings.DOCUMENT_IMAGE_STORAGE = {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        'OPTIONS': {'location': str(tmp_path / 'images')},
+    }
+    Image.new('RGB', (800, 1000)).save(str(tmp_path / 'HLSL_NUR_00001001.jpg'))
+    assert make_derivatives(str(tmp_path / 'HLSL_NUR_00001001.jpg'), 'HLSL_NUR_00001001', [DocumentImage.THUMB, DocumentImage.HALF], 'webp') == ((800, 1000), [
+        (DocumentImage.THUMB, '/proxy_image/derivatives/thumb/HLSL_NUR_00001001.webp', 120, 150),
+        (DocumentImage.HALF, '/proxy_image/derivatives/half/HLSL_NUR_00001001.webp', 400, 500),
+    ])
+    with Image.open(str(tmp_path / 'images' / 'derivatives' / 'thumb' / 'HLSL_NUR_00001001.webp')) as thumb:
+        assert (thumb.format, thumb.size) == ('WEBP', (120, 150))
+
+    # generated images are served through the image proxy, from the documents bucket
+    image = DocumentImage(url='/proxy_image/derivatives/thumb/HLSL_NUR_00001001.webp')
+    assert image.source_url() == settings.DOCUMENTS_URL + 'derivatives/thumb/HLSL_NUR_00001001.webp'
+
+    assert make_derivatives(str(tmp_path / 'missing.jpg'), 'missing', [DocumentImage.THUMB], 'webp') is None
+
+    # any format Pillow reads, and a page too narrow for a scale still reports its size
+    Image.new('P', (300, 300)).save(str(tmp_path / 'HLSL_NUR_00001002.png'))
+    assert make_derivatives(str(tmp_path / 'HLSL_NUR_00001002.png'), 'HLSL_NUR_00001002', [DocumentImage.THUMB, DocumentImage.HALF], 'jpeg') == ((300, 300), [
+        (DocumentImage.THUMB, '/proxy_image/derivatives/thumb/HLSL_NUR_00001002.jpg', 120, 120),
+    ])
+
+    # a failure saving one image is reported for that image, rather than raised out of the worker pool
+    settings.DOCUMENT_IMAGE_STORAGE = {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        'OPTIONS': {'location': str(tmp_path / 'HLSL_NUR_00001001.jpg')},
+    }
+    assert make_derivatives(str(tmp_path / 'HLSL_NUR_00001001.jpg'), 'HLSL_NUR_00001001', [DocumentImage.THUMB], 'webp') is None
@@ -3,6 +3,8 @@ from . import views
 
 app_name = 'documents'
 urlpatterns = [
+    re_path(r'^(?P<document_id>\d+)/images$', views.Images.as_view(), name='images'),
+    re_path(r'^(?P<document_id>\d+)/pdf$', views.Pdf.as_view(), name='pdf'),
     re_path(r'^(?P<document_id>\d+)-(?P<slug>[-\w]+)?$', views.Show.as_view(), name='show'),
     re_path(r'^(?P<document_id>\d+)[-\w]*$', views.Show.as_view()),
 ]
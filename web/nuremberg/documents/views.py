@@ -1,18 +1,178 @@
-from .models import Document
+from .models import Document, DocumentImage, DocumentQuerySet
+from .manifests import document_storage
+from .pdf import stream_pdf
 
-from django.shortcuts import render
+import textwrap
+from tempfile import TemporaryFile
+
+from django.core.cache import caches
+from django.core.cache.utils import make_template_fragment_key
+from django.core.files import File
+from django.db.models import prefetch_related_objects
+from django.http.response import FileResponse, JsonResponse, StreamingHttpResponse
+from django.http import Http404
+from django.shortcuts import get_object_or_404, render
 from django.views.generic import View
 
+def page_param(request, name, default):
+    """
+    The page number in the `name` query parameter, or `default` if it's missing or not a number.
+    """
+    try:
+        return int(request.GET.get(name, default))
+    except ValueError:
+        return default
+
+
 class Show(View):
     template_name = 'documents/show.html'
+    # cached fragments of the template, keyed on the document id and cache version
+    fragments = ('document_info', 'document_images')
+    # pages rendered into the HTML; the viewer fetches the rest from Images as they scroll into view
+    initial_pages = 50
+
     def get(self, request, document_id, *args, **kwargs):
         document = Document.objects \
-        .prefetch_related('images') \
         .select_related('language') \
         .select_related('source') \
         .get(id=document_id)
 
+        cache_version = document.cache_version()
+        if not self.is_cached(document, cache_version):
+            prefetch_related_objects([document], *DocumentQuerySet.display_relations())
+
         return render(request, self.template_name,
             {'document': document,
+            'cache_version': cache_version,
+            'initial_pages': self.initial_pages,
             'query': request.GET.get('q'),
         })
+
+    @classmethod
+    def fragment_keys(cls, document, cache_version):
+        return [make_template_fragment_key(fragment, [document.id, cache_version]) for fragment in cls.fragments]
+
+    @classmethod
+    def is_cached(cls, document, cache_version):
+        keys = cls.fragment_keys(document, cache_version)
+        return len(caches['persistent'].get_many(keys)) == len(keys)
+
+
+class Images(View):
+    """
+    Image metadata for a window of a document's pages, read from its image manifest.
+    """
+    max_pages = 200
+    scale_names = dict(DocumentImage.IMAGE_SCALES)
+
+    def get(self, request, document_id, *args, **kwargs):
+        document = get_object_or_404(Document.objects.only('id', 'updated_at'), id=document_id)
+        from_page = page_param(request, 'from', 1)
+        to_page = min(page_param(request, 'to', from_page + Show.initial_pages - 1), from_page + self.max_pages - 1)
+        scale = request.GET.get('scale', DocumentImage.SCREEN)
+
+        page_images = document.page_images()
+        urls = {}
+        for image in page_images:
+            if from_page <= image.page_number <= to_page:
+                urls.setdefault(image.page_number, {}).setdefault(self.scale_names.get(image.scale), image.display_url)
+
+        images = [{
+                'page': image.page_number,
+                'url': image.display_url,
+                'width': image.width,
+                'height': image.height,
+                'image_type': image.image_type_id,
+                'urls': urls[image.page_number],
+            } for image in page_images
+            if image.scale == scale and from_page <= image.page_number <= to_page]
+
+        return JsonResponse({
+            'document_id': document.id,
+            'total_pages': sum(1 for image in page_images if image.scale == scale),
+            'from_page': from_page,
+            'to_page': to_page,
+            'scale': scale,
+            'images': images,
+        })
+
+
+class Pdf(View):
+    """
+    A PDF of a range of a document's pages, streamed as each page image is fetched.
+
+    PDFs of the whole document are saved to DOCUMENT_STORAGE as they stream, keyed on
+    the document's cache version, and served from there until the document or its
+    images change. Other ranges are only streamed, so storage holds one PDF per document.
+    """
+    def get(self, request, document_id, *args, **kwargs):
+        document = get_object_or_404(Document.objects.only('id', 'title', 'literal_title', 'updated_at'), id=document_id)
+        index = document.image_index()
+        pages = sorted(page_number for (page_number, scale) in index if scale == DocumentImage.SCREEN)
+        if not pages:
+            raise Http404('Document has no images')
+        from_page = max(page_param(request, 'from', pages[0]), pages[0])
+        to_page = min(page_param(request, 'to', pages[-1]), pages[-1])
+        if to_page < from_page:
+            (from_page, to_page) = (to_page, from_page)
+
+        if from_page == to_page:
+            filename = 'HLSL Nuremberg Document #{} page {}.pdf'.format(document.id, from_page)
+        else:
+            filename = 'HLSL Nuremberg Document #{} pages {}-{}.pdf'.format(document.id, from_page, to_page)
+
+        whole = (from_page, to_page) == (pages[0], pages[-1])
+        storage = document_storage()
+        path = self.pdf_path(document)
+        if whole and storage.exists(path):
+            return FileResponse(storage.open(path), as_attachment=True, filename=filename, content_type='application/pdf')
+
+        sources = []
+        for page_number in range(from_page, to_page + 1):
+            # the full scale image if there is one, as the viewer's page download offers
+            image = index.get((page_number, DocumentImage.FULL)) or index.get((page_number, DocumentImage.SCREEN))
+            sources.append(image.source_url() if image else None)
+
+        chunks = stream_pdf(sources, self.cover(document, from_page, to_page))
+        response = StreamingHttpResponse(self.save_as_streamed(path, chunks) if whole else chunks,
+            content_type='application/pdf')
+        response['Content-Disposition'] = 'attachment; filename="{}"'.format(filename)
+        return response
+
+    @staticmethod
+    def pdf_path(document):
+        return 'pdfs/{:05d}/{}.pdf'.format(document.id, document.cache_version())
+
+    @staticmethod
+    def cover(document, from_page, to_page):
+        lines = ['Harvard Law School Library - Nuremberg Trials Project', '']
+        lines += textwrap.wrap(document.title, 80) + ['']
+        lines += textwrap.wrap(document.literal_title, 80) + ['']
+        date = document.date()
+        lines.append(date.strftime('%d %B %Y') if date else 'Date Unknown')
+        lines += ['', 'Pages {} to {} included'.format(from_page, to_page)]
+        return lines
+
+    @staticmethod
+    def save_as_streamed(path, chunks):
+        """
+        Passes the PDF through to the client, saving it to storage once the last chunk is sent.
+        A PDF the client stops downloading is discarded.
+        """
+        storage = document_storage()
+        with TemporaryFile() as file:
+            for chunk in chunks:
+                file.write(chunk)
+                yield chunk
+            file.seek(0)
+            if not storage.exists(path):
+                saved = storage.save(path, File(file))
+                if saved != path:
+                    # a concurrent download saved it first, and storage picked another name for this copy
+                    storage.delete(saved)
+
+        # PDFs of earlier versions of the document won't be requested again
+        (directory, name) = path.rsplit('/', 1)
+        for other in storage.listdir(directory)[1]:
+            if other != name:
+                storage.delete(directory + '/' + other)
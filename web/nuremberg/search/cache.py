@@ -0,0 +1,84 @@
+"""
+A cache of Solr search results, shared between processes in the search cache.
+
+Results are keyed by the Solr query and its parameters in a canonical order, so
+searches for the same query, filters, material types, date range, sort and page
+share an entry however their URLs order those parameters. Keys also include the
+index generation, which update_index and clear_index bump, so reindexing retires
+every cached result at once; otherwise entries expire after SEARCH_CACHE_TIMEOUT
+seconds. The search cache has its own size limit, so culling its many entries
+never evicts the transcript renders and manifests in the persistent cache.
+
+Facet counts are cached apart from the results, without the parameters that only
+page, sort or highlight them, so every page of a search shares one set of counts
+and only the first one asks Solr for them. They are kept for SEARCH_FACETS_CACHE_TIMEOUT.
+"""
+import time
+from hashlib import sha1
+
+from django.conf import settings
+from django.core.cache import caches
+
+GENERATION_KEY = 'search-index-generation'
+FACET_PARAMS = ('facets', 'date_facets', 'query_facets')
+# search parameters that don't change facet counts
+UNFACETED_PARAMS = ('start_offset', 'end_offset', 'sort_by', 'sort', 'group.sort', 'group.limit', 'highlight', 'result_class')
+
+
+def index_generation():
+    cache = caches['search']
+    # start a new generation if the counter has been evicted, so older entries are never reused
+    generation = time.time_ns()
+    if not cache.add(GENERATION_KEY, generation, None):
+        generation = cache.get(GENERATION_KEY, generation)
+    return generation
+
+
+def bump_index_generation():
+    caches['search'].set(GENERATION_KEY, time.time_ns(), None)
+
+
+def canonical(value):
+    """
+    `value` with dicts and sets sorted and classes named, so equal parameters have equal reprs.
+    """
+    if isinstance(value, dict):
+        return sorted(((str(key), canonical(item)) for (key, item) in value.items()), key=repr)
+    if isinstance(value, (set, frozenset)):
+        return sorted((canonical(item) for item in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [canonical(item) for item in value]
+    if isinstance(value, type):
+        return '{}.{}'.format(value.__module__, value.__qualname__)
+    return value
+
+
+def cache_key(query_string, search_kwargs, kind='results'):
+    params = repr((query_string, canonical(search_kwargs))).encode('utf8')
+    return 'search-{}-{}-{}'.format(kind, index_generation(), sha1(params).hexdigest())
+
+
+def facets_cache_key(query_string, search_kwargs):
+    """
+    The key of the search's facet counts, or None if it doesn't ask for any.
+    """
+    if not any(search_kwargs.get(param) for param in FACET_PARAMS):
+        return None
+    params = {key: value for (key, value) in search_kwargs.items() if key not in UNFACETED_PARAMS}
+    return cache_key(query_string, params, kind='facets')
+
+
+def get_results(key):
+    return caches['search'].get(key)
+
+
+def set_results(key, results):
+    caches['search'].set(key, results, settings.SEARCH_CACHE_TIMEOUT)
+
+
+def get_facets(key):
+    return caches['search'].get(key)
+
+
+def set_facets(key, facets):
+    caches['search'].set(key, facets, settings.SEARCH_FACETS_CACHE_TIMEOUT)
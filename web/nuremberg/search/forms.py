@@ -112,10 +112,12 @@ class FieldedSearchForm(SearchForm):
     def __init__(self, *args, **kwargs):
         self.sort_results = kwargs.pop('sort_results')
         self.transcript_id = kwargs.pop('transcript_id', None)
+        self.highlight_results = kwargs.pop('highlight_results', True)
 
         super().__init__(*args, **kwargs)
         if 'm' in self.data:
-            included = self.data.getlist('m')
+            # sorted, so the query (and its cached results) doesn't depend on the order of the checkboxes
+            included = sorted(self.data.getlist('m'))
             self.data = self.data.copy()
             if len(included) < 3:
                 self.data['q'] += ' type:{}'.format('|'.join(included))
@@ -157,7 +159,7 @@ class FieldedSearchForm(SearchForm):
         for field_query in self.field_queries:
             sqs = self.apply_field_query(sqs, field_query)
 
-        if self.highlight_query:
+        if self.highlight_query and self.highlight_results:
             sqs = sqs.highlight(**{
                 'hl.snippets': highlight_snippets,
                 'hl.fragsize':150,
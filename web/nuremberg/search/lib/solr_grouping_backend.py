@@ -8,11 +8,16 @@ from __future__ import absolute_import
 import logging
 
 from django.apps import apps
+from django.conf import settings
 from haystack.backends import EmptyResults
 from haystack.backends.solr_backend import SolrEngine, SolrSearchBackend, SolrSearchQuery
 from haystack.constants import DJANGO_CT, DJANGO_ID, ID
 from haystack.models import SearchResult
 from haystack.query import SearchQuerySet
+from pysolr import SolrError
+
+from nuremberg.search import cache as search_cache
+from nuremberg.search.timing import SearchTiming, count_response_bytes
 
 # Since there's no chance of this being portable (yet!) we'll import explicitly
 # rather than using the generic imports:
@@ -70,57 +75,77 @@ class GroupedSearchQuery(SolrSearchQuery):
                         'group.limit': 3,  # TODO: Don't hard-code this
                         'group.sort': 'date desc',
                         'group.facet': 'true',
+                        'fields': [ID, DJANGO_CT, DJANGO_ID, 'score'] + list(GroupedSearchResult.fields),
                         'result_class': GroupedSearchResult})
             res.update(self.grouping_params)
         return res
 
 
 class GroupedSearchResult(object):
+    # the fields of each document that search results (search/document-row.html) use;
+    # Solr returns only these, and they are the only ones converted
+    fields = ('title', 'literal_title', 'slug', 'material_type', 'source', 'date', 'total_pages',
+              'authors', 'case_tags', 'evidence_codes', 'exhibit_codes',
+              'transcript_id', 'page_label', 'text', 'thumb_url')
 
-    def __init__(self, field_name, group_data, raw_results={}):
+    def __init__(self, field_name, group_data, raw_results={}, converters=None):
         self.field_name = field_name
         self.key = group_data['groupValue']  # TODO: convert _to_python
         self.hits = group_data['doclist']['numFound']
         self.documents = list(self.process_documents(group_data['doclist']['docs'],
-                                                     raw_results=raw_results))
+                                                     raw_results=raw_results,
+                                                     converters=converters or DocumentConverters()))
 
     def __unicode__(self):
         return 'GroupedSearchResult({0.field_name}={0.group_key}, hits={0.hits})'.format(self)
 
-    def process_documents(self, doclist, raw_results):
-        # TODO: tame import spaghetti
-        from haystack import connections
-        engine = connections["default"]
-        conn = engine.get_backend().conn
-
-        unified_index = engine.get_unified_index()
-        indexed_models = unified_index.get_indexed_models()
+    def process_documents(self, doclist, raw_results, converters):
+        highlighting = getattr(raw_results, 'highlighting', {})
 
         for raw_result in doclist:
-            app_label, model_name = raw_result[DJANGO_CT].split('.')
-            additional_fields = {}
-            model = apps.get_model(app_label, model_name)
+            model_converters = converters[raw_result[DJANGO_CT]]
+            if model_converters is None:
+                continue
 
-            if model and model in indexed_models:
-                for key, value in raw_result.items():
-                    index = unified_index.get_index(model)
-                    string_key = str(key)
+            (app_label, model_name, field_converters) = model_converters
+            additional_fields = {field: convert(raw_result[field])
+                                 for (field, convert) in field_converters if field in raw_result}
 
-                    if string_key in index.fields and hasattr(index.fields[string_key], 'convert'):
-                        additional_fields[string_key] = index.fields[string_key].convert(value)
-                    else:
-                        additional_fields[string_key] = conn._to_python(value)
+            if raw_result[ID] in highlighting:
+                additional_fields['highlighted'] = highlighting[raw_result[ID]]
 
-                del(additional_fields[DJANGO_CT])
-                del(additional_fields[DJANGO_ID])
-                del(additional_fields['score'])
+            yield SearchResult(app_label, model_name, raw_result[DJANGO_ID],
+                               raw_result['score'], **additional_fields)
 
-                if raw_result[ID] in getattr(raw_results, 'highlighting', {}):
-                    additional_fields['highlighted'] = raw_results.highlighting[raw_result[ID]]
 
-                result = SearchResult(app_label, model_name, raw_result[DJANGO_ID],
-                                      raw_result['score'], **additional_fields)
-                yield result
+class DocumentConverters(dict):
+    """
+    Maps each django_ct in a response to its app label, model name and a converter
+    for each of `GroupedSearchResult.fields`, or to None if its model isn't indexed.
+    Each model is looked up once per response, rather than for every field of every document.
+    """
+
+    def __init__(self, using='default'):
+        super(DocumentConverters, self).__init__()
+        # TODO: tame import spaghetti
+        from haystack import connections
+        engine = connections[using]
+        self.to_python = engine.get_backend().conn._to_python
+        self.unified_index = engine.get_unified_index()
+        self.indexed_models = set(self.unified_index.get_indexed_models())
+
+    def __missing__(self, django_ct):
+        app_label, model_name = django_ct.split('.')
+        model = apps.get_model(app_label, model_name)
+
+        if model in self.indexed_models:
+            index_fields = self.unified_index.get_index(model).fields
+            converters = [(field, index_fields[field].convert if field in index_fields else self.to_python)
+                          for field in GroupedSearchResult.fields]
+            self[django_ct] = (app_label, model_name, converters)
+        else:
+            self[django_ct] = None
+        return self[django_ct]
 
 
 class GroupedSearchQuerySet(SearchQuerySet):
@@ -157,6 +182,75 @@ class GroupedSearchQuerySet(SearchQuerySet):
 
 class GroupedSolrSearchBackend(SolrSearchBackend):
 
+    def __init__(self, *args, **kwargs):
+        super(GroupedSolrSearchBackend, self).__init__(*args, **kwargs)
+        self.conn.get_session().hooks['response'].append(count_response_bytes)
+
+    def search(self, query_string, **kwargs):
+        # SolrSearchBackend.search, with results and facet counts cached (see nuremberg.search.cache)
+        if len(query_string) == 0:
+            return {'results': [], 'hits': 0}
+
+        key = search_cache.cache_key(query_string, kwargs)
+        facets_key = search_cache.facets_cache_key(query_string, kwargs)
+        results = search_cache.get_results(key)
+        facets = search_cache.get_facets(facets_key) if facets_key else None
+        if results is not None and not facets_key:
+            SearchTiming(query_string, kwargs).cached()
+            return results
+        if results is not None and facets is not None:
+            SearchTiming(query_string, kwargs).cached()
+            return dict(results, facets=facets)
+
+        if facets is not None:
+            # another page of this search has counted the facets already
+            kwargs = {param: value for (param, value) in kwargs.items() if param not in search_cache.FACET_PARAMS}
+        (results, failed) = self.run_search(query_string, **kwargs)
+        if failed:
+            return results
+
+        if facets_key:
+            if facets is None:
+                search_cache.set_facets(facets_key, results['facets'])
+            else:
+                results['facets'] = facets
+            search_cache.set_results(key, dict(results, facets=None))
+        else:
+            search_cache.set_results(key, results)
+        return results
+
+    def run_search(self, query_string, **kwargs):
+        """
+        Queries Solr, returning the processed results and whether the query failed.
+        """
+        if kwargs.get('narrow_queries'):
+            # build_search_kwargs adds the model filter to the query's own set, which would
+            # change the cache keys of its later runs (e.g. the page after the count)
+            kwargs['narrow_queries'] = set(kwargs['narrow_queries'])
+        search_kwargs = self.build_search_kwargs(query_string, **kwargs)
+        if settings.SOLR_TIMING_PHASES:
+            search_kwargs['debug'] = 'timing'
+
+        timing = SearchTiming(query_string, kwargs)
+        try:
+            raw_results = self.conn.search(query_string, **search_kwargs)
+            failed = False
+        except (IOError, SolrError) as e:
+            if not self.silently_fail:
+                raise
+
+            self.log.error("Failed to query Solr using '%s': %s", query_string, e, exc_info=True)
+            raw_results = EmptyResults()
+            failed = True
+        timing.received(raw_results)
+
+        results = self._process_results(raw_results,
+                                        highlight=kwargs.get('highlight'),
+                                        result_class=kwargs.get('result_class', SearchResult),
+                                        distance_point=kwargs.get('distance_point'))
+        timing.processed(results, failed)
+        return (results, failed)
+
     def build_search_kwargs(self, *args, **kwargs):
         group_kwargs = [(i, kwargs[i]) for i in kwargs.keys() if i.startswith("group")]
         for (i, ki) in group_kwargs: del kwargs[i]
@@ -189,6 +283,7 @@ class GroupedSolrSearchBackend(SolrSearchBackend):
         assert len(raw_results.grouped) == 1, "Grouping on more than one field is not supported"
 
         res['results'] = results = []
+        converters = DocumentConverters(self.connection_alias)
         for field_name, field_group in raw_results.grouped.items():
             res['hits'] = field_group['ngroups']
             res['matches'] = field_group['matches']
@@ -197,7 +292,7 @@ class GroupedSolrSearchBackend(SolrSearchBackend):
                     logging.warning("Unexpected NULL grouping", extra={'data': raw_results})
                     res['hits'] -= 1  # Avoid confusing Haystack with excluded bogon results
                     continue
-                results.append(result_class(field_name, group, raw_results=raw_results))
+                results.append(result_class(field_name, group, raw_results=raw_results, converters=converters))
 
         return res
 
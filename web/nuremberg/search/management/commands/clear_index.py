@@ -0,0 +1,13 @@
+from haystack.management.commands import clear_index
+from nuremberg.search.cache import bump_index_generation
+
+
+class Command(clear_index.Command):
+    help = clear_index.Command.help + ' Retires all cached search results.'
+
+    def handle(self, **options):
+        try:
+            return super().handle(**options)
+        finally:
+            # even a partial clear may have changed the index
+            bump_index_generation()
@@ -0,0 +1,13 @@
+from haystack.management.commands import update_index
+from nuremberg.search.cache import bump_index_generation
+
+
+class Command(update_index.Command):
+    help = update_index.Command.help + ' Retires all cached search results.'
+
+    def handle(self, *items, **options):
+        try:
+            return super().handle(*items, **options)
+        finally:
+            # even a partial update may have changed the index
+            bump_index_generation()
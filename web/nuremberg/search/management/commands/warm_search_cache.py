@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.urls import reverse
+from nuremberg.search.views import Search
+
+
+class Command(BaseCommand):
+    help = 'Runs searches through the search page so their results and facet counts are cached (e.g. after update_index)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('queries', nargs='*', default=['*'], help='Queries to search for (default is the blank search of the search page)')
+        parser.add_argument('--pages', type=int, default=1, help='Result pages of each query to cache (default 1; facet counts are shared by every page)')
+
+    def handle(self, *args, **options):
+        view = Search.as_view()
+        for query in options['queries']:
+            for page in range(1, options['pages'] + 1):
+                # the view runs the searches while building its context, so there is no need to render it
+                view(RequestFactory().get(reverse('search:search'), {'q': query, 'page': page}))
+            print('Cached', options['pages'], 'pages of', repr(query))
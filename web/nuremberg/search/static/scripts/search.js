@@ -23,7 +23,7 @@ modulejs.define('search', function () {
   }
   var SearchView = Backbone.View.extend({
     el: 'main',
-    initialize: function () {
+    initFacets: function () {
       var $dateForm = $('.date-filter-form').on('submit', function (e) {
         e.preventDefault();
         e.stopPropagation();
@@ -85,6 +85,18 @@ modulejs.define('search', function () {
         },
       });
 
+      $('.facet .collapse').on('click', function () {
+        $(this).closest('.facet').toggleClass('collapsed');
+      });
+
+      $('.facet .show-all').on('click', function () {
+        $(this).addClass('hide')
+        .closest('.facet').children('p').removeClass('hide');
+      });
+    },
+    initialize: function () {
+      this.initFacets();
+
       if (location.hash === '#advanced') {
         $('.advanced-search-help').removeClass('hide');
       }
@@ -99,10 +111,6 @@ modulejs.define('search', function () {
         }
       });
 
-      $('.facet .collapse').on('click', function () {
-        $(this).closest('.facet').toggleClass('collapsed');
-      });
-
       $('.clear-search').on('click', function (e) {
         e.preventDefault();
         $form = $(this).closest('form')
@@ -110,11 +118,6 @@ modulejs.define('search', function () {
         submitForm($form);
       });
 
-      $('.facet .show-all').on('click', function () {
-        $(this).addClass('hide')
-        .closest('.facet').children('p').removeClass('hide');
-      });
-
       $('.results-sort select').on('change', function () {
         gotoResults($(this).val());
       });
@@ -131,6 +134,10 @@ modulejs.define('search', function () {
       currentLoad.abort();
       clearTimeout(loadingTimeout);
     }
+    if (currentFacetsLoad) {
+      currentFacetsLoad.abort();
+      currentFacetsLoad = null;
+    }
     loadingTimeout = setTimeout( function () {
         var $indicator = $('.loading-indicator').removeClass('hide');
         $indicator.find('.spinner').remove();
@@ -154,6 +161,7 @@ modulejs.define('search', function () {
       loadingTimeout = null;
       $('main').html(html);
       searchView = new SearchView({el: $('main')});
+      loadFacets();
     })
     .fail(function (xhr, status) {
       if (status !== 'abort') {
@@ -163,6 +171,30 @@ modulejs.define('search', function () {
     })
   }
 
+  // partial results leave out the facet counts, which come in a second request
+  var currentFacetsLoad = null;
+
+  var loadFacets = function () {
+    var $facets = $('.search-facets[data-facets-url]');
+    if (!$facets.length) {
+      return;
+    }
+    currentFacetsLoad = $.ajax({
+      url: $facets.data('facets-url')
+    });
+    currentFacetsLoad.then(function (html) {
+      currentFacetsLoad = null;
+      $facets.find('.facets-loading').replaceWith(html);
+      $facets.removeAttr('data-facets-url');
+      searchView.initFacets();
+    })
+    .fail(function (xhr, status) {
+      if (status !== 'abort') {
+        $facets.find('.facets-loading').text('Filters could not be loaded.');
+      }
+    });
+  }
+
   var gotoResults = function (href) {
     if (location.search === href) {
       return;
@@ -102,6 +102,12 @@ def clear_facets(context):
     params.setlist('year_max', [])
     return '?{}'.format(encode_query(params))
 
+@register.simple_tag(takes_context=True)
+def facets_url(context):
+    # the sidebar's links keep every other parameter of the search page
+    params = cleaned_params(context)
+    return '{}?{}'.format(reverse('search:facets'), encode_query(params))
+
 @register.simple_tag
 def group_merge(results, key):
     values = set()
@@ -75,6 +75,16 @@ def test_facets(query):
     page = follow_link(page('a').with_text('Clear all filters'))
     assert 'Results 1-15 of 24 for polish workers in germany' in page.text()
 
+def test_partial_search():
+    # partial pages leave the facets to a second request
+    page = go_to(search_url('polish workers in germany') + '&partial=1')
+    assert 'Results 1-15 of 24 for polish workers in germany' in page.text()
+    assert not page('.facet')
+
+    facets = go_to(page('.search-facets').attr('data-facets-url'))
+    assert 'NMT 2' in facets('.facet').with_text('Trial').text()
+    assert not facets('.document-row')
+
 def test_keyword_search(query):
     page = query('')
     search_bar = page('input[type="search"]')
@@ -254,3 +264,99 @@ def test_sort(query):
     assert '0 pages' in page.text()
     page = follow_link(page('a.page-number').with_text('698'))
     assert '492 pages' in page.text()
+
+def test_search_timing():
+    response = client.get(search_url('workers'))
+    # the count and the page of results
+    assert 'Solr: 2 queries' in response['Server-Timing']
+
+def test_search_cache_key(settings):
+    from nuremberg.search.cache import cache_key, bump_index_generation
+    from nuremberg.search.lib.solr_grouping_backend import GroupedSearchResult
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+        'search': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    }
+
+    params = {
+        'narrow_queries': {'language_exact:"English"', 'source_exact:"Typescript"'},
+        'sort_by': ['date_sort asc'],
+        'start_offset': 15,
+        'end_offset': 30,
+        'result_class': GroupedSearchResult,
+    }
+    key = cache_key('(text:(workers))', params)
+
+    # the same search in any parameter order shares a key
+    assert cache_key('(text:(workers))', dict(reversed(list(params.items())),
+        narrow_queries={'source_exact:"Typescript"', 'language_exact:"English"'})) == key
+    assert cache_key('(text:(workers))', dict(params, start_offset=30, end_offset=45)) != key
+    assert cache_key('(text:(workers))', dict(params, narrow_queries={'language_exact:"English"'})) != key
+
+    # reindexing retires every key
+    bump_index_generation()
+    assert cache_key('(text:(workers))', params) != key
+
+def test_clear_index_retires_cached_results(settings, monkeypatch):
+    from django.core.management import call_command
+    from haystack.management.commands import clear_index
+    from nuremberg.search.cache import cache_key
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+        'search': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    }
+    # leave the index itself alone
+    monkeypatch.setattr(clear_index.Command, 'handle', lambda self, **options: None)
+
+    key = cache_key('*', {})
+    call_command('clear_index', interactive=False)
+    assert cache_key('*', {}) != key
+
+def test_search_facets_cache_key(settings):
+    from nuremberg.search.cache import facets_cache_key
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+        'search': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    }
+
+    params = {
+        'narrow_queries': {'language_exact:"English"'},
+        'facets': {'material_type': {'missing': True, 'sort': 'count', 'mincount': 1}},
+        'group.facet': 'true',
+        'sort_by': ['date_sort asc'],
+        'start_offset': 0,
+        'end_offset': 15,
+    }
+    key = facets_cache_key('(text:(workers))', params)
+
+    # every page and sort of a search shares its facet counts
+    assert facets_cache_key('(text:(workers))', dict(params, start_offset=15, end_offset=30, sort_by=['-score'])) == key
+    assert facets_cache_key('(text:(workers))', dict(params, narrow_queries=set())) != key
+    assert facets_cache_key('(text:(workers))', dict(params, facets=None)) is None
+
+def test_grouped_search_result():
+    from nuremberg.search.lib.solr_grouping_backend import GroupedSearchResult
+
+    class RawResults:
+        highlighting = {'transcripts.transcriptpage.8': {'highlight': ['<mark>experiment</mark>']}}
+
+    page = {'django_ct': 'transcripts.transcriptpage', 'material_type': 'Transcript', 'title': 'Transcript for NMT 1: Medical Case',
+        'transcript_id': '1', 'total_pages': '11000', 'case_tags': ['NMT 1'], 'evidence_codes': ['NO-1'], 'highlight': 'text', 'seq_number': 8}
+    group = GroupedSearchResult('grouping_key', {'groupValue': 'Transcript_1', 'doclist': {'numFound': 2, 'docs': [
+        dict(page, id='transcripts.transcriptpage.8', django_id='8', score=2.0, page_label='32'),
+        dict(page, id='transcripts.transcriptpage.9', django_id='9', score=1.0),
+    ]}}, raw_results=RawResults())
+
+    assert group.key == 'Transcript_1'
+    assert group.hits == 2
+    (first, second) = group.documents
+    assert (first.model_name, first.pk, first.score) == ('transcriptpage', '8', 2.0)
+    assert first.total_pages == 11000
+    assert first.case_tags == ['NMT 1']
+    assert first.page_label == '32'
+    assert first.highlighted == {'highlight': ['<mark>experiment</mark>']}
+    # only the fields search results show are converted
+    assert first.seq_number is None
+    assert first.highlight is None
+    assert second.page_label is None
+    assert second.highlighted is None
@@ -0,0 +1,113 @@
+"""
+Timing of Solr searches, to tell whether a slow search page is waiting on Solr,
+turning Solr's response into results, or something else (e.g. rendering).
+
+GroupedSolrSearchBackend times each search with a `SearchTiming`, which logs it to
+the `nuremberg.search` logger: at DEBUG, or at WARNING when Solr took longer than
+SOLR_SLOW_QUERY_SECONDS. The log records carry the measurements in `extra['solr']`.
+During a request, SearchTimingMiddleware collects them into a summary, which it logs
+at INFO and returns in a Server-Timing header.
+"""
+import contextvars
+import logging
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger('nuremberg.search')
+
+# the searches of the current request, while SearchTimingMiddleware collects them
+request_searches = contextvars.ContextVar('request_searches', default=None)
+response_bytes = contextvars.ContextVar('response_bytes', default=0)
+
+
+def count_response_bytes(response, **kwargs):
+    """
+    A requests response hook for the Solr session, counting the bytes Solr returns.
+    """
+    response_bytes.set(response_bytes.get() + len(response.content))
+
+
+def milliseconds(seconds):
+    return round(seconds * 1000, 1)
+
+
+def format_stats(stats):
+    return ' '.join('{}={!r}'.format(key, value) for (key, value) in stats.items())
+
+
+class SearchTiming:
+
+    def __init__(self, query_string, search_kwargs):
+        """
+        Starts timing a search, given the arguments of GroupedSolrSearchBackend.search.
+        """
+        start = search_kwargs.get('start_offset') or 0
+        end = search_kwargs.get('end_offset')
+        self.stats = {
+            'query': query_string,
+            'start': start,
+            'rows': end - start if end is not None else None,
+            'facets': bool(search_kwargs.get('facets')),
+            'highlight': bool(search_kwargs.get('highlight')),
+            'cached': False,
+        }
+        response_bytes.set(0)
+        self.started = time.perf_counter()
+
+    def received(self, raw_results):
+        """
+        Call when Solr has answered, with its raw results.
+        """
+        self.received_at = time.perf_counter()
+        self.stats.update({
+            'solr_ms': milliseconds(self.received_at - self.started),
+            'qtime_ms': getattr(raw_results, 'qtime', None),
+            'bytes': response_bytes.get(),
+        })
+        # with SOLR_TIMING_PHASES, Solr times each of its search components
+        phases = (getattr(raw_results, 'debug', None) or {}).get('timing', {}).get('process', {})
+        self.stats['phases_ms'] = {name: phase['time'] for (name, phase) in phases.items()
+            if isinstance(phase, dict) and name != 'debug'}
+
+    def processed(self, results, failed=False):
+        """
+        Call when the raw results have been turned into Haystack results.
+        """
+        self.stats.update({
+            'process_ms': milliseconds(time.perf_counter() - self.received_at),
+            'hits': results.get('hits'),
+            'matches': results.get('matches'),
+            'groups': len(results.get('results') or []),
+            'failed': failed,
+        })
+        self.record()
+
+    def cached(self):
+        self.stats['cached'] = True
+        self.record()
+
+    def record(self):
+        searches = request_searches.get()
+        if searches is not None:
+            searches.append(self.stats)
+
+        slow = not self.stats['cached'] and self.stats['solr_ms'] > settings.SOLR_SLOW_QUERY_SECONDS * 1000
+        logger.log(logging.WARNING if slow else logging.DEBUG, '%s: %s',
+            'Slow Solr query' if slow else 'Solr query', format_stats(self.stats), extra={'solr': self.stats})
+
+
+def summarize(searches):
+    """
+    Totals of the timings of a request's searches.
+    """
+    timed = [search for search in searches if not search['cached']]
+    return {
+        'searches': len(searches),
+        'cached': len(searches) - len(timed),
+        'solr_ms': round(sum(search['solr_ms'] for search in timed), 1),
+        'qtime_ms': sum(search['qtime_ms'] or 0 for search in timed),
+        'process_ms': round(sum(search['process_ms'] for search in timed), 1),
+        'bytes': sum(search['bytes'] for search in timed),
+        'groups': sum(search['groups'] for search in timed),
+    }
@@ -4,5 +4,6 @@ from . import views
 app_name = 'search'
 urlpatterns = [
     # re_path(r'$', views.Search.as_view(), name='search'),
+    re_path(r'^facets$', views.Facets.as_view(), name='facets'),
     re_path(r'$', views.Search.as_view(), name='search')
 ]
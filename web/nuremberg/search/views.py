@@ -70,16 +70,26 @@ class Search(FacetedSearchView):
         kwargs.update({
             'sort_results': self.request.GET.get(self.sort_field, self.default_sort),
             'selected_facets': self.request.GET.getlist(self.filter_field),
-            'facet_to_label': self.facet_to_label
+            'facet_to_label': self.facet_to_label,
+            'highlight_results': self.show_results(),
         })
         return kwargs
 
+    def show_facets(self):
+        # facet counts are the most expensive part of a search, so partial pages
+        # (loaded by search.js) leave them out and fetch them from `Facets` instead
+        return not self.request.GET.get('partial')
+
+    def show_results(self):
+        return True
+
     def get_queryset(self):
         # override FacetedSearchMixin
         qs = super(FacetedSearchMixin, self).get_queryset()
-        for field in self.facet_fields:
-            sort = 'count'
-            qs = qs.facet(field, missing=True, sort=sort, mincount=1)
+        if self.show_facets():
+            for field in self.facet_fields:
+                sort = 'count'
+                qs = qs.facet(field, missing=True, sort=sort, mincount=1)
         return qs
 
     def get_context_data(self, **kwargs):
@@ -114,8 +124,29 @@ class Search(FacetedSearchView):
             context['base_template'] = 'search/partial.html'
         else:
             context['base_template'] = None
+        context['defer_facets'] = not self.show_facets()
 
         return context
 
     def get_paginator(self, *args, **kwargs):
         return self.paginator_class(*args, body=self.context_pages, tail=self.edge_pages, **kwargs)
+
+
+class Facets(Search):
+    """
+    Just the facet sidebar of a search, which partial search pages load separately.
+    """
+    template_name = 'search/search_facets.html'
+    paginate_by = None
+
+    def show_facets(self):
+        return True
+
+    def show_results(self):
+        return False
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        # ask Solr for no result rows at all, only the facet counts
+        qs.query.set_limits(0, 0)
+        return qs
@@ -7,8 +7,15 @@ COMPRESS_ENABLED = False
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
-    }
+    },
+    'persistent': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    'search': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
 }
+PROXY_CACHE = None
 
 STATIC_PRECOMPILER_COMPILERS = (
     ('static_precompiler.compilers.LESS', {
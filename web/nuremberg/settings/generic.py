@@ -46,11 +46,11 @@ INSTALLED_APPS = [
     'compressor',
 
     'haystack',
-    'proxy',
     'static_precompiler',
 ]
 
 MIDDLEWARE = [
+    'nuremberg.core.middlewares.search_timing.SearchTimingMiddleware',
     'nuremberg.core.middlewares.crawler.BlockCrawlerMiddleware',
     'django.middleware.cache.UpdateCacheMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -166,6 +166,41 @@ COMPRESS_STORAGE = 'compressor.storage.GzipCompressorFileStorage'
 
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedStaticFilesStorage'
 
+# The default cache backs the site-wide cache middleware. The persistent cache
+# holds expensive rendered output (e.g. joined transcript pages) whose keys
+# change whenever the underlying data does, so it is shared between processes
+# and never expires. Past MAX_ENTRIES, a random 1/CULL_FREQUENCY of it is deleted.
+# Django's file cache lists its whole directory to check for that on every write,
+# so the persistent cache only checks every CULL_EVERY writes (per process).
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'persistent': {
+        'BACKEND': 'nuremberg.core.cache.InfrequentlyCulledFileCache',
+        'LOCATION': os.environ.get('CACHE_DIR', os.path.join(BASE_DIR, 'cache')),
+        'TIMEOUT': None,
+        'OPTIONS': {
+            'MAX_ENTRIES': 100000,
+            'CULL_FREQUENCY': 3,
+            'CULL_EVERY': 1000,
+        },
+    },
+    # Solr search results, kept apart so the many of them cull each other rather than
+    # the transcript renders and manifests in the persistent cache
+    'search': {
+        'BACKEND': 'nuremberg.core.cache.InfrequentlyCulledFileCache',
+        'LOCATION': os.environ.get('SEARCH_CACHE_DIR', os.path.join(BASE_DIR, 'search_cache')),
+        'TIMEOUT': None,
+        'OPTIONS': {
+            'MAX_ENTRIES': 50000,
+            'CULL_FREQUENCY': 3,
+            'CULL_EVERY': 1000,
+        },
+    },
+}
+
 HAYSTACK_CONNECTIONS = {
     'default': {
         'ENGINE': 'nuremberg.search.lib.solr_grouping_backend.GroupedSolrEngine',
@@ -174,6 +209,19 @@ HAYSTACK_CONNECTIONS = {
 }
 HAYSTACK_DEFAULT_OPERATOR = 'AND'
 
+# Solr search results are kept in the search cache for this many seconds,
+# or until update_index or clear_index runs (see nuremberg.search.cache). Facet counts, shared
+# by every page of a search, are kept longer.
+SEARCH_CACHE_TIMEOUT = 60 * 60 * 24
+SEARCH_FACETS_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+# Solr searches are timed and logged to the nuremberg.search logger (see nuremberg.search.timing):
+# each request's totals at INFO, each query at DEBUG, and queries over SOLR_SLOW_QUERY_SECONDS
+# at WARNING. SOLR_TIMING_PHASES also has Solr time its query (with grouping), facet and
+# highlight components, at the cost of a little extra work.
+SOLR_SLOW_QUERY_SECONDS = 1.0
+SOLR_TIMING_PHASES = False
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -187,9 +235,33 @@ LOGGING = {
             'handlers': ['console'],
             'level': os.getenv('DJANGO_LOG_LEVEL', 'INFO'),
         },
+        'nuremberg.search': {
+            'handlers': ['console'],
+            'level': os.getenv('SEARCH_LOG_LEVEL', 'INFO'),
+        },
     },
 }
 
+# Files derived from document images (image manifests and PDFs) are kept in this
+# storage, alongside the images in the local minio documents bucket. Any Django
+# storage backend works, e.g. FileSystemStorage to keep them on local disk.
+# Manifests are replaced in place, so S3 storages must overwrite (file_overwrite).
+DOCUMENT_STORAGE = {
+    'BACKEND': 'storages.backends.s3boto3.S3Boto3Storage',
+    'OPTIONS': {
+        'endpoint_url': 'http://minio:9000',
+        'bucket_name': 'nuremberg-documents',
+        'access_key': os.environ.get('MINIO_ROOT_USER', 'accesskey'),
+        'secret_key': os.environ.get('MINIO_ROOT_PASSWORD', 'secretkey'),
+        'querystring_auth': False,
+        'file_overwrite': True,
+    },
+}
+
+# Images generated by generate_image_derivatives are saved here, and served by the
+# image proxy from DOCUMENTS_URL, so this should be the same bucket.
+DOCUMENT_IMAGE_STORAGE = DOCUMENT_STORAGE
+
 # Look for images in AWS S3
 # DOCUMENTS_URL = 'http://s3.amazonaws.com/nuremberg-documents/'
 # DOCUMENTS_PRINTING_URL = 'http://nuremberg.law.harvard.edu/imagedir/HLSL_NUR_printing/'
@@ -203,3 +275,21 @@ DOCUMENTS_PRINTING_URL = DOCUMENTS_URL
 TRANSCRIPTS_URL = 'http://minio:9000/nuremberg-transcripts/'
 PROXY_DOCUMENT_IMAGE_THUMBS = True
 PROXY_TRANSCRIPTS = True
+
+# Proxied images are streamed from the buckets above, and browsers may keep them for PROXY_MAX_AGE seconds.
+# Images up to MAX_FILE_SIZE bytes (thumbnails, mostly) are also kept on local disk,
+# up to MAX_SIZE bytes in total, dropping the least recently served first, and fetched
+# again once they're PROXY_MAX_AGE seconds old.
+PROXY_TIMEOUT = 30
+PROXY_MAX_AGE = 60 * 60 * 24 * 30
+PROXY_CACHE = {
+    'LOCATION': os.environ.get('PROXY_CACHE_DIR', os.path.join(BASE_DIR, 'proxy_cache')),
+    'MAX_SIZE': 1024 * 1024 * 1024,
+    'MAX_FILE_SIZE': 64 * 1024,
+}
+
+# Behind the nginx in nginx.conf, proxied images can be left to nginx entirely:
+# Django answers with an X-Accel-Redirect to one of its internal locations instead.
+# Those locations proxy fixed upstreams, which must match DOCUMENTS_URL and TRANSCRIPTS_URL;
+# printing images are only handed to nginx while DOCUMENTS_PRINTING_URL is DOCUMENTS_URL.
+PROXY_ACCEL_REDIRECT = False
@@ -9,3 +9,6 @@ ALLOWED_HOSTS = os.environ['ALLOWED_HOSTS'].split(',')
 
 COMPRESS_OFFLINE = True
 COMPRESS_ENABLED = True
+
+# set when served behind nginx.conf, which then transfers and caches proxied images
+PROXY_ACCEL_REDIRECT = os.environ.get('PROXY_ACCEL_REDIRECT', '').lower() in ('1', 'true', 'yes')
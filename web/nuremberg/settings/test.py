@@ -11,5 +11,20 @@ TEMPLATES[0]['OPTIONS']['debug'] = True
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
-    }
+    },
+    'persistent': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    'search': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+}
+PROXY_CACHE = None
+
+# document manifests and PDFs are kept on local disk, rather than in minio
+DOCUMENT_STORAGE = {
+    'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    'OPTIONS': {
+        'location': os.path.join(BASE_DIR, 'document_files'),
+    },
 }
@@ -0,0 +1,31 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcripts', '0006_transcript_activities'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptRender',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_seq', models.IntegerField()),
+                ('to_seq', models.IntegerField()),
+                ('total_pages', models.IntegerField()),
+                ('pages_updated_at', models.DateTimeField()),
+                ('joined_from_seq', models.IntegerField(blank=True, null=True)),
+                ('joined_to_seq', models.IntegerField(blank=True, null=True)),
+                ('html', models.BinaryField()),
+                ('transcript', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='renders', to='transcripts.transcript')),
+            ],
+            options={
+                'unique_together': {('transcript', 'from_seq', 'to_seq')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 09:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transcripts', '0008_transcriptpage_extracted_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcriptpage',
+            name='xml_hash',
+            field=models.CharField(blank=True, max_length=40, null=True),
+        ),
+    ]
@@ -1,13 +1,18 @@
 import re
+import zlib
+from hashlib import sha1
 from io import BytesIO
 from lxml import etree
 from datetime import datetime
 from django.conf import settings
-from django.urls import reverse
+from django.core.cache import caches
+from django.db.models import Max
+from django.template.loader import render_to_string
 from django.utils.text import slugify
 from django.utils.functional import cached_property
 
 from django.db import models
+from nuremberg.core.proxy import proxy_prefix
 from nuremberg.documents.models import DocumentCase, DocumentActivity
 from .xml import TranscriptPageJoiner
 
@@ -55,6 +60,74 @@ class Transcript(models.Model):
 
         return seq_number
 
+    @staticmethod
+    def aligned_seq_range(seq_number, alignment):
+        # so that page ranges are generally cacheable, we align initial page loads to 10-page strides, plus 1
+        # e.g. requesting seq=10, 13, or 19 will get you pages 1 - 30 inclusive,
+        # so all future range requests will be aligned to 31 - 40 and so on.
+        from_seq = (seq_number // alignment) * alignment - alignment
+        to_seq = (seq_number // alignment) * alignment + alignment + 1
+        return (from_seq, to_seq)
+
+    def aligned_seq_ranges(self, alignment):
+        """
+        Every clamped seq range that an initial page load can request.
+        """
+        for seq_number in range(0, self.total_pages + 1, alignment):
+            (from_seq, to_seq) = self.aligned_seq_range(seq_number, alignment)
+            yield (self.clamp_seq(from_seq), self.clamp_seq(to_seq))
+
+    def scroll_seq_ranges(self, alignment):
+        """
+        Every clamped seq range that scrolling away from an aligned range can request.
+        transcripts.js asks for `alignment` pages after the last page shown, or before the
+        first, plus the shown page they join to, so from an aligned start every request
+        is a stride of `alignment` plus 1.
+        """
+        for seq_number in range(0, self.total_pages, alignment):
+            yield (self.clamp_seq(seq_number), self.clamp_seq(seq_number + alignment + 1))
+
+    def render_pages(self, from_seq, to_seq):
+        """
+        Join and render the pages in a seq range (see TranscriptPageJoiner).
+        Returns a dict with the rendered `html`, and the `from_seq` and `to_seq`
+        actually displayed.
+        """
+        pages = self.pages.filter(seq_number__gte=from_seq, seq_number__lte=to_seq).all()
+        joiner = TranscriptPageJoiner(pages, include_first=from_seq == 1, include_last=to_seq == self.total_pages)
+        joiner.build_html()
+        return {
+            'html': render_to_string('transcripts/joined_pages.html', {'pages': joiner.html_pages}),
+            'from_seq': joiner.from_seq,
+            'to_seq': joiner.to_seq,
+        }
+
+    def joined_pages(self, from_seq, to_seq):
+        """
+        Cached version of `render_pages`.
+
+        The output is kept in the persistent cache. Cache keys include the most
+        recent `updated_at` of the pages in range, so re-ingesting any of them
+        invalidates every range that contains it. On a cache miss, a current
+        TranscriptRender saved by `prerender_transcripts` is used if there is one.
+        """
+        updated_at = self.pages.filter(seq_number__gte=from_seq, seq_number__lte=to_seq) \
+            .aggregate(updated_at=Max('updated_at'))['updated_at']
+        key = 'transcript-{}-{}-{}-{}-{}'.format(self.id, self.total_pages, from_seq, to_seq,
+            updated_at.timestamp() if updated_at else 0)
+
+        cache = caches['persistent']
+        joined = cache.get(key)
+        if joined is None:
+            render = updated_at and self.renders.filter(from_seq=from_seq, to_seq=to_seq,
+                total_pages=self.total_pages, pages_updated_at__gte=updated_at).first()
+            if render:
+                joined = render.joined()
+            else:
+                joined = self.render_pages(from_seq, to_seq)
+            cache.set(key, joined)
+        return joined
+
 class TranscriptVolume(models.Model):
     transcript = models.ForeignKey(Transcript, related_name='volumes', on_delete=models.PROTECT)
 
@@ -84,39 +157,45 @@ class TranscriptPage(models.Model):
     image_url = models.TextField(blank=True, null=True)
 
     xml = models.TextField()
+    xml_hash = models.CharField(max_length=40, blank=True, null=True)
+
+    # denormalized output of `extract`, populated at ingest time so indexing never has to parse XML
+    extracted_text = models.TextField(blank=True, null=True)
+    extracted_evidence_codes = models.TextField(blank=True, null=True)
+    extracted_exhibit_codes = models.TextField(blank=True, null=True)
 
-    def __getattribute__(self, attrname):
-        orig = super().__getattribute__(attrname)
-        if attrname == 'image_url' and settings.PROXY_TRANSCRIPTS:
-            return reverse('proxy_transcript', kwargs={'path': orig.split('/')[-1]})
-        return orig
+    @property
+    def display_image_url(self):
+        """
+        The URL pages show this page's image at: `image_url`, or through the transcript proxy if PROXY_TRANSCRIPTS is set.
+        """
+        if self.image_url and settings.PROXY_TRANSCRIPTS:
+            return proxy_prefix('proxy_transcript') + self.image_url.rsplit('/', 1)[-1]
+        return self.image_url
 
     def xml_tree(self):
         return etree.fromstring(self.xml.encode('utf8'))
 
-    def populate_from_xml(self):
-        for event, element in etree.iterwalk(self.xml_tree()):
-            if event != 'end':
-                continue
-            if element.tag == 'seqNo':
-                self.seq_number = int(element.text)
-            elif element.tag == 'sessionDate':
-                try:
-                    self.date = datetime.strptime(element.get('n'), '%Y-%m-%d')
-                except:
-                    self.date = None
-            elif element.tag == 'pageNum':
-                self.page_label = element.get('n')
-                page_int = re.sub(r'[^\d]', '', self.page_label)
-                if page_int:
-                    self.page_number = int(page_int)
-                else:
-                    self.page_number = None
+    def extract(self):
+        """
+        Extracts everything we derive from the page XML in a single pass:
+        `text`, `evidence_codes`, `exhibit_codes`, and a `metadata` dict of
+        model fields found in the page.
 
-    def text(self):
-        # TODO: this blob won't allow exact phrase matches across transcript pages.
+        The result is memoized for as long as `xml` is unchanged. Only the
+        extracted values are kept, not the parsed tree, so bulk indexing holds
+        no more than one tree at a time.
+        """
+        memo = self.__dict__.get('_extracted')
+        if memo and memo[0] is self.xml:
+            return memo[1]
+
+        # TODO: this text blob won't allow exact phrase matches across transcript pages.
         # It might be extended a few words into either adjacent page to allow that.
         text = ''
+        evidence_codes = []
+        exhibit_codes = []
+        metadata = {}
         for event, element in etree.iterwalk(self.xml_tree(), events=('start', 'end')):
             if element.tag == 'p' :
                 if len(element) and element[0].tag == 'runningHead':
@@ -128,30 +207,79 @@ class TranscriptPage(models.Model):
                         text += element.text
                 else:
                     text += '\n\n'
-            elif event == 'end' and element.tag == 'spkr':
+            elif event != 'end':
+                continue
+            elif element.tag == 'spkr':
                 if element.text:
                     text += '<span class="speaker">{}</span> '.format(element.text)
                 if element.tail: text += element.tail
-            elif event == 'end' and element.tag in ('evidenceFileDoc', 'exhibitDocDef', 'exhibitDocPros'):
+            elif element.tag in ('evidenceFileDoc', 'exhibitDocDef', 'exhibitDocPros'):
                 if element.text: text += element.text
                 if element.tail: text += element.tail
-        return text
+                if not element.get('n'):
+                    # an uncoded reference has nothing to search it by
+                    continue
+                if element.tag == 'evidenceFileDoc':
+                    evidence_codes.append(element.get('n'))
+                elif element.tag == 'exhibitDocPros':
+                    exhibit_codes.append('Prosecution {}'.format(element.get('n')))
+                else:
+                    exhibit_codes.append('{} {}'.format(element.get('def') or 'Unknown Defendant', element.get('n')))
+            elif element.tag == 'seqNo':
+                metadata['seq_number'] = int(element.text)
+            elif element.tag == 'sessionDate':
+                try:
+                    metadata['date'] = datetime.strptime(element.get('n'), '%Y-%m-%d')
+                except:
+                    metadata['date'] = None
+            elif element.tag == 'pageNum':
+                metadata['page_label'] = element.get('n')
+                page_int = re.sub(r'[^\d]', '', metadata['page_label'])
+                if page_int:
+                    metadata['page_number'] = int(page_int)
+                else:
+                    metadata['page_number'] = None
+
+        extracted = {
+            'text': text,
+            'evidence_codes': evidence_codes,
+            'exhibit_codes': exhibit_codes,
+            'metadata': metadata,
+        }
+        self._extracted = (self.xml, extracted)
+        return extracted
+
+    @staticmethod
+    def hash_xml(xml):
+        return sha1(xml.encode('utf8')).hexdigest()
+
+    def populate_from_xml(self, extracted=None):
+        extracted = extracted or self.extract()
+        for field, value in extracted['metadata'].items():
+            setattr(self, field, value)
+        self.xml_hash = self.hash_xml(self.xml)
+        self.populate_extracted_fields(extracted)
+
+    def populate_extracted_fields(self, extracted=None):
+        extracted = extracted or self.extract()
+        self.extracted_text = extracted['text']
+        self.extracted_evidence_codes = '\n'.join(code for code in extracted['evidence_codes'] if code)
+        self.extracted_exhibit_codes = '\n'.join(code for code in extracted['exhibit_codes'] if code)
+
+    def text(self):
+        if self.extracted_text is not None:
+            return self.extracted_text
+        return self.extract()['text']
 
     def extract_evidence_codes(self):
-        codes = []
-        for event, element in etree.iterwalk(self.xml_tree()):
-            if element.tag == 'evidenceFileDoc':
-                codes.append(element.get('n'))
-        return codes
+        if self.extracted_evidence_codes is not None:
+            return [code for code in self.extracted_evidence_codes.split('\n') if code]
+        return list(self.extract()['evidence_codes'])
 
     def extract_exhibit_codes(self):
-        codes = []
-        for event, element in etree.iterwalk(self.xml_tree()):
-            if element.tag == 'exhibitDocPros':
-                codes.append('Prosecution {}'.format(element.get('n')))
-            elif element.tag == 'exhibitDocDef':
-                codes.append('{} {}'.format(element.get('def') or 'Unknown Defendant', element.get('n')))
-        return codes
+        if self.extracted_exhibit_codes is not None:
+            return [code for code in self.extracted_exhibit_codes.split('\n') if code]
+        return list(self.extract()['exhibit_codes'])
 
     class Meta:
         unique_together = (
@@ -164,3 +292,38 @@ class TranscriptPage(models.Model):
                 ('transcript', 'date'),
                 ('volume', 'volume_seq_number')
             )
+
+
+class TranscriptRender(models.Model):
+    """
+    A seq range pre-rendered by the `prerender_transcripts` management command,
+    so that `Transcript.joined_pages` doesn't have to parse any XML.
+    The HTML is stored zlib-compressed.
+    """
+    transcript = models.ForeignKey(Transcript, related_name='renders', on_delete=models.CASCADE)
+
+    from_seq = models.IntegerField()
+    to_seq = models.IntegerField()
+    total_pages = models.IntegerField()
+    pages_updated_at = models.DateTimeField()
+
+    joined_from_seq = models.IntegerField(blank=True, null=True)
+    joined_to_seq = models.IntegerField(blank=True, null=True)
+    html = models.BinaryField()
+
+    def joined(self):
+        return {
+            'html': zlib.decompress(self.html).decode('utf8'),
+            'from_seq': self.joined_from_seq,
+            'to_seq': self.joined_to_seq,
+        }
+
+    def set_joined(self, joined):
+        self.html = zlib.compress(joined['html'].encode('utf8'))
+        self.joined_from_seq = joined['from_seq']
+        self.joined_to_seq = joined['to_seq']
+
+    class Meta:
+        unique_together = (
+                ('transcript', 'from_seq', 'to_seq'),
+            )
@@ -41,6 +41,16 @@ class TranscriptPageIndex(indexes.SearchIndex, indexes.Indexable):
     def get_updated_field(self):
         return 'updated_at'
 
+    def index_queryset(self, using=None):
+        pages = TranscriptPage.objects \
+            .select_related('transcript__case') \
+            .select_related('volume')
+        # text and codes are read from denormalized fields, so skip loading the XML --
+        # unless some pages haven't been backfilled and would each fetch it to extract
+        if not TranscriptPage.objects.filter(extracted_text__isnull=True).exists():
+            pages = pages.defer('xml')
+        return pages.all()
+
     def prepare_grouping_key(self, page):
         # This is a hack to group transcripts but not pages in a single query.
         # Transcripts get a group key, pages get a unique key.
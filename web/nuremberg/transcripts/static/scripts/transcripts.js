@@ -16,6 +16,7 @@ modulejs.define('transcript-viewer', function () {
   var fromSeq = $text.data('from-seq');
   var toSeq = $text.data('to-seq');
   var query = $('input[name=q]').val();
+  // Show.page_alignment, so that prerender_transcripts renders the ranges scrolling requests
   var batchSize = 10;
 
   $('.print-document').on('click', function () {
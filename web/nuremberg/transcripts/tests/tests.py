@@ -4,6 +4,9 @@ from nuremberg.transcripts.models import Transcript, TranscriptPage
 from django.core.management import call_command
 from datetime import datetime
 from os import path
+import json
+import tarfile
+import zipfile
 
 @pytest.fixture
 def seq():
@@ -110,6 +113,46 @@ def test_seq_alignment(seq):
     assert "Seq. No. 30" in page('.page-handle').nth(-1).text()
     assert 'The only defendant in the dock who was directly responsible to Hitler himself is the defendant Karl Brandt.' in page.text()
 
+def test_scroll_seq_ranges():
+    transcript = Transcript.objects.get(id=1)
+    scroll_ranges = set(transcript.scroll_seq_ranges(10))
+
+    # scrolling requests the ranges transcripts.js would, from each end of what's shown
+    shown = client.get(url_with_query('transcripts:show', transcript.id, transcript.slug(), seq=25, partial=1)).json()
+    for n in range(2):
+        below = (shown['to_seq'], min(transcript.total_pages, shown['to_seq'] + 11))
+        above = (max(1, shown['from_seq'] - 11), shown['from_seq'])
+        assert below in scroll_ranges
+        assert above in scroll_ranges
+        shown = client.get(url_with_query('transcripts:show', transcript.id, transcript.slug(),
+            from_seq=below[0], to_seq=below[1], partial=1)).json()
+
+def test_joined_pages_cache(settings, django_assert_num_queries):
+    settings.CACHES = dict(settings.CACHES, persistent={'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'})
+    transcript = Transcript.objects.get(id=1)
+
+    joined = transcript.joined_pages(30, 51)
+    assert 'HLSL Seq. No. 31' in joined['html']
+    assert joined['from_seq'] == 31
+
+    # a cache hit only needs to check the range's updated_at
+    with django_assert_num_queries(1):
+        assert transcript.joined_pages(30, 51) == joined
+
+    # saving a page in range invalidates it
+    transcript.pages.get(seq_number=40).save()
+    with django_assert_num_queries(2):
+        assert transcript.joined_pages(30, 51) == joined
+
+def test_transcript_page_display_image_url(settings):
+    settings.PROXY_TRANSCRIPTS = True
+    page = TranscriptPage(image_url='//s3.amazonaws.com/nuremberg-transcripts/NRMB-NMT01-23_00512_0.jpg')
+    assert page.display_image_url == '/proxy_transcript/NRMB-NMT01-23_00512_0.jpg'
+    assert page.image_url == '//s3.amazonaws.com/nuremberg-transcripts/NRMB-NMT01-23_00512_0.jpg'
+
+    settings.PROXY_TRANSCRIPTS = False
+    assert page.display_image_url == page.image_url
+
 def test_go_to_date(seq):
     page = seq(100)
 
@@ -197,3 +240,127 @@ def test_xml_import():
     assert 'The defendants Karl Brandt, Genzken, Gebhardt, Rudolf Brandt' in transcript_page.text()
     assert transcript_page.extract_evidence_codes() == ['NO-416', 'NO-417']
     assert transcript_page.extract_exhibit_codes() == ['Prosecution 22']
+
+    # re-ingesting unchanged xml leaves the page alone, so it isn't reindexed
+    updated_at = transcript_page.updated_at
+    call_command('ingest_transcript_xml', path.join(abspath, 'good/NRMB-NMT01-01_00136_0.xml'))
+    assert TranscriptPage.objects.get(id=transcript_page.id).updated_at == updated_at
+
+
+def test_extract_uncoded_references():
+    page = TranscriptPage(xml='<page><p>See <evidenceFileDoc>this</evidenceFileDoc> and '
+        '<evidenceFileDoc n="NO-417">that</evidenceFileDoc>, <exhibitDocPros>an exhibit</exhibitDocPros> '
+        'and <exhibitDocDef def="Rose" n="8">another</exhibitDocDef>.</p></page>')
+    page.populate_extracted_fields()
+    assert 'See this and that, an exhibit and another.' in page.text()
+    assert page.extract_evidence_codes() == ['NO-417']
+    assert page.extract_exhibit_codes() == ['Rose 8']
+
+
+def page_filename(seq):
+    return 'NRMB-NMT01-01_{:05d}_0.xml'.format(seq)
+
+def write_pages(directory, seqs):
+    """
+    Writes copies of the good XML file to `directory`, as pages of volume 1 with the given sequence numbers.
+    """
+    with open(path.join(path.dirname(path.abspath(__file__)), 'good/NRMB-NMT01-01_00136_0.xml')) as file:
+        xml = file.read()
+    directory.mkdir()
+    for seq in seqs:
+        (directory / page_filename(seq)).write_text(xml.replace('<seqNo>136</seqNo>', '<seqNo>{}</seqNo>'.format(seq)))
+    return directory
+
+def test_xml_import_batches(tmp_path):
+    seqs = [90001, 90002, 90003, 90004, 90005]
+    directory = write_pages(tmp_path / 'pages', seqs)
+
+    call_command('ingest_transcript_xml', str(directory), d=True, batch_size=2)
+    assert ingested_seqs(seqs) == seqs
+    pages = {page.volume_seq_number: page for page in TranscriptPage.objects.filter(volume_id=1, volume_seq_number__in=seqs)}
+    assert pages[90005].page_number == 121
+    assert pages[90005].extract_evidence_codes() == ['NO-416', 'NO-417']
+
+    # changed pages are updated in place, and unchanged ones are left alone
+    changed = directory / page_filename(90003)
+    changed.write_text(changed.read_text().replace('<pageNum n="121">121</pageNum>', '<pageNum n="122">122</pageNum>'))
+    call_command('ingest_transcript_xml', str(directory), d=True, batch_size=2)
+    for page in TranscriptPage.objects.filter(volume_id=1, volume_seq_number__in=seqs):
+        assert page.id == pages[page.volume_seq_number].id
+        if page.volume_seq_number == 90003:
+            assert page.page_number == 122
+            assert page.updated_at > pages[90003].updated_at
+        else:
+            assert page.page_number == 121
+            assert page.updated_at == pages[page.volume_seq_number].updated_at
+
+def tar_pages(tmp_path, seqs, name='pages.tar', mode='w'):
+    directory = write_pages(tmp_path / name.split('.')[0], seqs)
+    with tarfile.open(tmp_path / name, mode) as archive:
+        for seq in seqs:
+            archive.add(directory / page_filename(seq), arcname=page_filename(seq))
+    return tmp_path / name
+
+def zip_pages(tmp_path, seqs):
+    directory = write_pages(tmp_path / 'zip', seqs)
+    with zipfile.ZipFile(tmp_path / 'pages.zip', 'w') as archive:
+        # members are ingested in sorted order, whatever order they were added in
+        for seq in reversed(seqs):
+            archive.write(directory / page_filename(seq), arcname='pages/' + page_filename(seq))
+    return tmp_path / 'pages.zip'
+
+def ingested_seqs(seqs):
+    return sorted(TranscriptPage.objects.filter(volume_id=1, volume_seq_number__in=seqs).values_list('seq_number', flat=True))
+
+def test_xml_import_archives(tmp_path):
+    zipped = zip_pages(tmp_path, [90001, 90002])
+    tarred = tar_pages(tmp_path, [90003, 90004], name='pages.tar.gz', mode='w:gz')
+
+    call_command('ingest_transcript_xml', str(zipped), str(tarred), batch_size=3)
+    assert ingested_seqs(range(90001, 90005)) == [90001, 90002, 90003, 90004]
+    page = TranscriptPage.objects.get(volume_id=1, volume_seq_number=90004)
+    assert page.page_number == 121
+    assert page.image_url.endswith('/NRMB-NMT01-01_90004_0.jpg')
+    assert 'The defendants Karl Brandt, Genzken, Gebhardt, Rudolf Brandt' in page.text()
+
+@pytest.mark.parametrize('source', ['directory', 'tar'])
+def test_xml_import_checkpoint(tmp_path, source):
+    seqs = [90001, 90002, 90003, 90004]
+    if source == 'tar':
+        source = tar_pages(tmp_path, seqs)
+    else:
+        source = write_pages(tmp_path / 'pages', seqs)
+    checkpoint = tmp_path / 'checkpoint.json'
+
+    # an uninterrupted run ingests every page, recording the last one
+    call_command('ingest_transcript_xml', str(source), d=True, checkpoint=str(checkpoint), batch_size=1)
+    assert ingested_seqs(seqs) == seqs
+    assert json.loads(checkpoint.read_text()) == {str(source): page_filename(90004)}
+
+    # resuming skips the pages up to the checkpoint
+    TranscriptPage.objects.filter(volume_id=1, volume_seq_number__in=seqs).delete()
+    checkpoint.write_text(json.dumps({str(source): page_filename(90002)}))
+    call_command('ingest_transcript_xml', str(source), d=True, checkpoint=str(checkpoint), batch_size=1)
+    assert ingested_seqs(seqs) == [90003, 90004]
+    assert json.loads(checkpoint.read_text()) == {str(source): page_filename(90004)}
+
+def test_xml_import_checkpoint_mismatch(tmp_path):
+    from django.core.management.base import CommandError
+
+    seqs = [90001, 90002]
+    source = tar_pages(tmp_path, seqs)
+    checkpoint = tmp_path / 'checkpoint.json'
+
+    # resuming a different archive at the same path fails, rather than skipping all of it
+    checkpoint.write_text(json.dumps({str(source): page_filename(90009)}))
+    with pytest.raises(CommandError):
+        call_command('ingest_transcript_xml', str(source), checkpoint=str(checkpoint))
+    assert ingested_seqs(seqs) == []
+
+    # archives read from stdin must be named to be checkpointed
+    with pytest.raises(CommandError):
+        call_command('ingest_transcript_xml', '-', checkpoint=str(checkpoint))
+
+    # directories are only read with -d
+    call_command('ingest_transcript_xml', str(write_pages(tmp_path / 'loose', seqs)))
+    assert ingested_seqs(seqs) == []
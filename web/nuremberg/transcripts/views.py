@@ -1,11 +1,9 @@
 from datetime import datetime
 from django.shortcuts import render
-from django.template.loader import render_to_string
 from django.http.response import JsonResponse
 from django.views.generic import View
 from nuremberg.search.views import Search as GenericSearchView
 from .models import Transcript
-from .xml import TranscriptPageJoiner
 import json
 
 class Search(GenericSearchView):
@@ -25,6 +23,10 @@ class Search(GenericSearchView):
         })
         return kwargs
 
+    def show_facets(self):
+        # pages within a transcript have no facets to filter by
+        return False
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context.update({
@@ -55,17 +57,15 @@ class Show(View):
         from_seq = transcript.clamp_seq(from_seq)
         to_seq = transcript.clamp_seq(to_seq)
 
-        pages = transcript.pages.filter(seq_number__gte=from_seq, seq_number__lte=to_seq).all()
-        joiner = TranscriptPageJoiner(pages, include_first=from_seq == 1, include_last=to_seq == total_pages)
-        joiner.build_html()
+        joined = transcript.joined_pages(from_seq, to_seq)
 
         if request.GET.get('partial'):
-            return JsonResponse({'html': render_to_string('transcripts/joined_pages.html', {'pages':joiner.html_pages}), 'from_seq': joiner.from_seq, 'to_seq': joiner.to_seq, 'seq': seq_number})
+            return JsonResponse({'html': joined['html'], 'from_seq': joined['from_seq'], 'to_seq': joined['to_seq'], 'seq': seq_number})
 
-        current_page = next(page for page in pages if page.seq_number == seq_number)
+        current_page = transcript.pages.defer('xml').get(seq_number=seq_number)
         return render(request, self.template_name, {
             'transcript': transcript,
-            'joiner': joiner,
+            'joined': joined,
             'seq': seq_number,
             'total_pages': total_pages,
             'dates': transcript.dates(),
@@ -76,10 +76,8 @@ class Show(View):
             })
 
     def get_request_seq_range(self, request, seq_number):
-        # so that page ranges are generally cacheable, we align initial page loads to 10-page strides, plus 1
-        # e.g. requesting seq=10, 13, or 19 will get you pages 1 - 30 inclusive,
-        # so all future range requests will be aligned to 31 - 40 and so on.
-        from_seq = int(request.GET.get('from_seq', (seq_number // self.page_alignment) * self.page_alignment - self.page_alignment))
-        to_seq = int(request.GET.get('to_seq', (seq_number // self.page_alignment) * self.page_alignment + self.page_alignment + 1))
+        (from_seq, to_seq) = Transcript.aligned_seq_range(seq_number, self.page_alignment)
+        from_seq = int(request.GET.get('from_seq', from_seq))
+        to_seq = int(request.GET.get('to_seq', to_seq))
 
         return (from_seq, to_seq)